@@ -0,0 +1,3 @@
+"""
+Offline benchmarks for valapi.py, run them with ``python -m benchmarks.<name>``
+"""
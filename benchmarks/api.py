@@ -0,0 +1,108 @@
+"""
+Latency and throughput of the Valorant client against the local mock server
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from benchmarks.mock_server import VERSION, MockRiot, match_id_for, mock_client
+from valorant.structs.structs import Version
+from valorant.valorant import Valorant
+
+
+def new_valorant(app: MockRiot) -> Valorant:
+    return Valorant("mock", "mock", client=mock_client(app))
+
+
+async def bench_auth(app: MockRiot, runs: int) -> list[float]:
+    """Seconds from a new client to a ready pd/glz session."""
+
+    timings = []
+    for _ in range(runs):
+        valorant = new_valorant(app)
+        start = time.perf_counter()
+        await valorant.start()
+        await valorant.get_session()
+        timings.append(time.perf_counter() - start)
+        await valorant.close()
+        await valorant.client.aclose()
+
+    return timings
+
+
+async def bench_single(valorant: Valorant, runs: int) -> list[float]:
+    timings = []
+    for index in range(runs):
+        start = time.perf_counter()
+        await valorant.get_match_details(match_id_for(index % 10))
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+async def bench_bulk(
+    valorant: Valorant, matches: int, concurrency: int
+) -> tuple[float, int]:
+    """Returns the elapsed seconds and the number of failed matches."""
+
+    failures = 0
+    start = time.perf_counter()
+    async for result in valorant.get_match_details_many(
+        [match_id_for(index) for index in range(matches)], concurrency
+    ):
+        failures += not result.ok
+
+    return time.perf_counter() - start, failures
+
+
+def describe(timings: list[float]) -> str:
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    return (
+        f"p50 {statistics.median(timings) * 1000:8.2f} ms"
+        f"  p95 {p95 * 1000:8.2f} ms  ({len(timings)} runs)"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    app = MockRiot(latency=args.latency, error_rate=args.error_rate, rounds=args.rounds)
+    for seed in range(args.matches):
+        # build the payloads up front so their generation is not measured
+        app.get_match(match_id_for(seed))
+
+    print(f"auth warm-up        {describe(await bench_auth(app, args.runs))}")
+
+    valorant = new_valorant(app)
+    valorant.versions.pin(Version(**VERSION))
+    await valorant.start()
+    await valorant.get_session()
+
+    print(f"get_match_details   {describe(await bench_single(valorant, args.runs))}")
+
+    elapsed, failures = await bench_bulk(valorant, args.matches, args.concurrency)
+    print(
+        f"bulk match details  {args.matches / elapsed:8.1f} matches/s"
+        f"  ({args.matches} matches, concurrency {args.concurrency},"
+        f" {failures} failed)"
+    )
+
+    await valorant.close()
+    await valorant.client.aclose()
+    print("requests served:", dict(sorted(app.requests.items())))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rounds", type=int, default=24)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--matches", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
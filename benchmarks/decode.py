@@ -0,0 +1,74 @@
+"""
+Decode time, peak memory and GC tracked objects per match payload
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import msgspec.json
+
+from benchmarks.fixtures import match_payload
+from valorant.decoding import get_decoder
+from valorant.structs.match import MatchDetails, MatchSummary
+
+
+def time_decode(payloads: list[bytes], decode, repeat: int) -> float:
+    """Returns the best mean seconds per payload over ``repeat`` runs."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for payload in payloads:
+            decode(payload)
+        best = min(best, (time.perf_counter() - start) / len(payloads))
+
+    return best
+
+
+def peak_memory(payload: bytes, decode) -> int:
+    tracemalloc.start()
+    match = decode(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del match
+    return peak
+
+
+def tracked_objects(payload: bytes, decode) -> int:
+    gc.collect()
+    before = len(gc.get_objects())
+    match = decode(payload)
+    after = len(gc.get_objects())
+    del match
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--matches", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = [match_payload(seed, args.rounds) for seed in range(args.matches)]
+    size = sum(map(len, payloads)) / len(payloads)
+    print(f"{args.matches} matches, {size / 1024:.0f} KiB per payload")
+
+    decoders = {
+        "msgspec.json.decode": lambda p: msgspec.json.decode(p, type=MatchDetails),
+        "cached Decoder": get_decoder(MatchDetails).decode,
+        "MatchSummary": get_decoder(MatchSummary).decode,
+    }
+    for name, decode in decoders.items():
+        seconds = time_decode(payloads, decode, args.repeat)
+        print(
+            f"{name:<22} {seconds * 1000:8.3f} ms/match"
+            f"  peak {peak_memory(payloads[0], decode) / 1024:8.0f} KiB"
+            f"  gc tracked {tracked_objects(payloads[0], decode):7d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
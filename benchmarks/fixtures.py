@@ -0,0 +1,199 @@
+"""
+Deterministic fixture payloads shaped like the Riot match endpoints
+"""
+
+import random
+import uuid
+
+import msgspec.json
+
+WEAPONS = [str(uuid.UUID(int=random.Random(i).getrandbits(128))) for i in range(18)]
+AGENTS = [
+    str(uuid.UUID(int=random.Random(100 + i).getrandbits(128))) for i in range(24)
+]
+MAPS = [f"/Game/Maps/Map{i}/Map{i}" for i in range(8)]
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128)))
+
+
+def _location(rng: random.Random) -> dict:
+    return {"x": rng.uniform(-8000, 8000), "y": rng.uniform(-8000, 8000)}
+
+
+def _kill(rng: random.Random, players: list[str], round_start: int) -> dict:
+    killer, victim = rng.sample(players, 2)
+    round_time = rng.randint(1000, 100000)
+    return {
+        "gameTime": round_start + round_time,
+        "roundTime": round_time,
+        "killer": killer,
+        "victim": victim,
+        "victimLocation": _location(rng),
+        "assistants": rng.sample(players, rng.randint(0, 2)),
+        "playerLocations": [
+            {
+                "subject": player,
+                "viewRadians": rng.uniform(0, 6.28),
+                "location": _location(rng),
+            }
+            for player in players
+        ],
+        "finishingDamage": {
+            "damageType": "Weapon",
+            "damageItem": rng.choice(WEAPONS),
+            "isSecondaryFireMode": False,
+        },
+    }
+
+
+def make_match(seed: int, rounds: int = 24, players: int = 10) -> dict:
+    """Builds a finished competitive match, the same ``seed`` gives the same match."""
+
+    rng = random.Random(seed)
+    player_ids = [_uuid(rng) for _ in range(players)]
+    teams = {player: "Blue" if i % 2 else "Red" for i, player in enumerate(player_ids)}
+    start = 1700000000000 + seed * 3600000
+
+    round_results = []
+    all_kills = []
+    for number in range(rounds):
+        round_start = number * 110000
+        player_stats = []
+        for player in player_ids:
+            kills = [
+                _kill(rng, player_ids, round_start)
+                for _ in range(rng.choice((0, 0, 1, 1, 2)))
+            ]
+            all_kills.extend(kills)
+            player_stats.append(
+                {
+                    "subject": player,
+                    "kills": kills,
+                    "damage": [
+                        {
+                            "receiver": receiver,
+                            "damage": rng.randint(1, 150),
+                            "legshots": rng.randint(0, 2),
+                            "bodyshots": rng.randint(0, 4),
+                            "headshots": rng.randint(0, 2),
+                        }
+                        for receiver in rng.sample(player_ids, rng.randint(0, 3))
+                    ],
+                    "score": rng.randint(0, 600),
+                    "economy": {
+                        "loadoutValue": rng.randint(0, 5000),
+                        "weapon": rng.choice(WEAPONS),
+                        "armor": rng.choice(("", _uuid(rng))),
+                        "remaining": rng.randint(0, 9000),
+                        "spent": rng.randint(0, 5000),
+                    },
+                    "wasAfk": False,
+                    "wasPenalized": False,
+                    "stayedInSpawn": False,
+                }
+            )
+
+        round_results.append(
+            {
+                "roundNum": number,
+                "roundResult": "Eliminated",
+                "roundCeremony": "CeremonyDefault",
+                "winningTeam": rng.choice(("Blue", "Red")),
+                "plantRoundTime": 0,
+                "plantSite": "",
+                "defuseRoundTime": 0,
+                "defuseLocation": _location(rng),
+                "playerStats": player_stats,
+                "roundResultCode": "Elimination",
+            }
+        )
+
+    return {
+        "matchInfo": {
+            "matchId": _uuid(rng),
+            "mapId": rng.choice(MAPS),
+            "gamePodId": "aresriot.aws-rclusterprod-euc1-1.eu-gp-frankfurt-1",
+            "gameLoopZone": "eu-gp-frankfurt-1",
+            "gameServerAddress": "",
+            "gameVersion": "release-08.00-shipping-9-2222222",
+            "gameLengthMillis": rounds * 110000,
+            "gameStartMillis": start,
+            "provisioningFlowID": "Matchmaking",
+            "isCompleted": True,
+            "customGameName": "",
+            "forcePostProcessing": False,
+            "queueID": "competitive",
+            "gameMode": "/Game/GameModes/Bomb/BombGameMode.BombGameMode_C",
+            "isRanked": True,
+            "isMatchSampled": False,
+            "seasonId": _uuid(random.Random(seed // 50)),
+            "completionState": "Completed",
+            "partyRRPenalties": {},
+            "shouldMatchDisablePenalties": False,
+        },
+        "players": [
+            {
+                "subject": player,
+                "gameName": f"player{i}",
+                "tagLine": "0000",
+                "teamId": teams[player],
+                "partyId": _uuid(rng),
+                "characterId": rng.choice(AGENTS),
+                "stats": {
+                    "score": rng.randint(1000, 9000),
+                    "roundsPlayed": rounds,
+                    "kills": rng.randint(0, 30),
+                    "deaths": rng.randint(0, 30),
+                    "assists": rng.randint(0, 15),
+                    "playtimeMillis": rounds * 110000,
+                    "abilityCasts": {
+                        "grenadeCasts": rng.randint(0, 20),
+                        "ability1Casts": rng.randint(0, 20),
+                        "ability2Casts": rng.randint(0, 20),
+                        "ultimateCasts": rng.randint(0, 4),
+                    },
+                },
+                "round_damage": [
+                    {"round": number, "receiver": rng.choice(player_ids), "damage": 50}
+                    for number in range(rounds)
+                ],
+                "competitiveTier": rng.randint(3, 27),
+                "isObserver": False,
+                "playerCard": _uuid(rng),
+                "playerTitle": _uuid(rng),
+                "preferredLevelBorder": "",
+                "accountLevel": rng.randint(1, 400),
+                "sessionPlayTimeMinutes": rng.randint(30, 300),
+                "xpModifications": [],
+                "behaviorFactors": {
+                    "afkRounds": 0,
+                    "commsRatingRecovery": 0,
+                    "damageParticipationOutgoing": 0,
+                    "friendlyFireIncoming": 0,
+                    "friendlyFireOutgoing": 0,
+                    "mouseMovement": 0,
+                    "stayedInSpawnRounds": 0,
+                },
+            }
+            for i, player in enumerate(player_ids)
+        ],
+        "coaches": [],
+        "kills": all_kills,
+        "teams": [
+            {
+                "teamId": team,
+                "won": team == "Blue",
+                "roundsPlayed": rounds,
+                "roundsWon": rounds // 2 + (team == "Blue"),
+                "numPoints": rounds // 2 + (team == "Blue"),
+            }
+            for team in ("Blue", "Red")
+        ],
+        "roundResults": round_results,
+    }
+
+
+def match_payload(seed: int, rounds: int = 24, players: int = 10) -> bytes:
+    return msgspec.json.encode(make_match(seed, rounds, players))
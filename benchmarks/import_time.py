@@ -0,0 +1,55 @@
+"""
+Import time of the package, measured in fresh interpreters
+"""
+
+import argparse
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import valorant": "import valorant",
+    "from valorant.structs.match import MatchDetails": (
+        "from valorant.structs.match import MatchDetails"
+    ),
+    "from valorant import Valorant": "from valorant import Valorant",
+    "from valorant import XMPP": "from valorant import XMPP",
+}
+
+
+def import_time(statement: str) -> int:
+    """Returns the cumulative import time in microseconds reported by -X importtime."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, package = line.split("|")
+        # only top level imports, their cumulative time includes the nested ones
+        if not package.startswith("   "):
+            total += int(cumulative)
+
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # interpreter startup imports (site, encodings, ...) are not ours
+    baseline = min(import_time("pass") for _ in range(args.runs))
+    for name, statement in STATEMENTS.items():
+        best = min(import_time(statement) for _ in range(args.runs)) - baseline
+        print(f"{name:<50} {best / 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
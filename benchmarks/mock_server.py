@@ -0,0 +1,239 @@
+"""
+A local stand-in for the Riot auth, entitlement, geo/PAS, pd and glz hosts
+
+:class:`MockRiot` is an ASGI app serving the fixture payloads, requests are
+routed by their host header so it can sit behind ``httpx.ASGITransport`` in
+place of the real network, or be served by any ASGI server.
+"""
+
+import asyncio
+import base64
+import json
+import random
+import re
+import time
+import uuid
+from urllib.parse import parse_qs
+
+import httpx
+import msgspec.json
+
+from benchmarks.fixtures import match_payload
+from valorant.ratelimit import RateLimitedTransport
+
+PLAYER_ID = "7f1d8c2e-8a52-4d52-9d7d-5c6b0b7d1a11"
+VERSION = {
+    "manifestId": "C330DFB0C2B5A79D",
+    "branch": "release-08.00",
+    "version": "08.00.00.2222222",
+    "buildVersion": "9",
+    "engineVersion": "4.27.2.0",
+    "riotClientVersion": "release-08.00-shipping-9-2222222",
+    "riotClientBuild": "80.0.1.1234567",
+    "buildDate": "2024-01-01T00:00:00Z",
+}
+
+
+def make_jwt(lifetime: float = 3600, **claims) -> str:
+    """Builds an unsigned JWT that expires ``lifetime`` seconds from now."""
+
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    payload = {"sub": PLAYER_ID, "exp": int(time.time() + lifetime)} | claims
+    return f"{encode({'alg': 'none'})}.{encode(payload)}.signature"
+
+
+def _match_seed(match_id: str) -> int:
+    return uuid.UUID(match_id).int % 100_000
+
+
+def match_id_for(seed: int) -> str:
+    """Returns a match ID the mock serves the fixture ``seed`` for."""
+
+    return str(uuid.UUID(int=seed))
+
+
+class MockRiot:
+    """
+    :param latency: seconds every response is delayed by
+    :param error_rate: share of pd/glz requests answered with ``error_status``
+    :param token_lifetime: lifetime in seconds of the issued tokens
+    :param history_size: number of matches in the player's match history
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 429,
+        token_lifetime: float = 3600,
+        history_size: int = 200,
+        rounds: int = 24,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.token_lifetime = token_lifetime
+        self.history_size = history_size
+        self.rounds = rounds
+
+        self.random = random.Random(seed)
+        self.requests: dict[str, int] = {}
+        self.__matches: dict[str, bytes] = {}
+
+    def get_match(self, match_id: str) -> bytes:
+        payload = self.__matches.get(match_id)
+        if payload is None:
+            payload = self.__matches[match_id] = match_payload(
+                _match_seed(match_id), self.rounds
+            )
+
+        return payload
+
+    def route(
+        self, method: str, host: str, path: str, query: dict
+    ) -> tuple[int, bytes]:
+        if host == "valorant-api.com" and path == "/v1/version":
+            return 200, msgspec.json.encode({"status": 200, "data": VERSION})
+
+        if host == "auth.riotgames.com":
+            if path == "/api/v1/authorization" and method == "POST":
+                return 200, b'{"type": "auth", "country": "esp"}'
+
+            if path == "/api/v1/authorization" and method == "PUT":
+                uri = (
+                    "http://localhost/redirect#access_token="
+                    f"{make_jwt(self.token_lifetime)}&scope=openid&iss=mock"
+                    f"&id_token={make_jwt(self.token_lifetime)}&token_type=Bearer"
+                    f"&session_state=mock&expires_in={int(self.token_lifetime)}"
+                )
+                return 200, msgspec.json.encode(
+                    {"type": "response", "response": {"parameters": {"uri": uri}}}
+                )
+
+            if path == "/userinfo":
+                return 200, msgspec.json.encode(
+                    {
+                        "country": "esp",
+                        "sub": PLAYER_ID,
+                        "email_verified": True,
+                        "pw": {"cng_at": 0, "reset": False, "must_reset": False},
+                        "phone_number_verified": False,
+                        "acct": {
+                            "type": 0,
+                            "state": "ENABLED",
+                            "adm": False,
+                            "game_name": "mock",
+                            "tag_line": "0000",
+                            "created_at": 0,
+                        },
+                        "jti": "mock",
+                    }
+                )
+
+        if host == "entitlements.auth.riotgames.com" and path == "/api/token/v1":
+            return 200, msgspec.json.encode(
+                {"entitlements_token": make_jwt(self.token_lifetime)}
+            )
+
+        if host == "riot-geo.pas.si.riotgames.com":
+            if path == "/pas/v1/product/valorant":
+                return (
+                    200,
+                    b'{"token": "mock", "affinities": {"pbe": "na", "live": "eu"}}',
+                )
+
+            if path == "/pas/v1/service/chat":
+                return 200, make_jwt(self.token_lifetime).encode()
+
+        if host.startswith("pd."):
+            return self.route_pd(path, query)
+
+        if host.startswith("glz-"):
+            match = re.fullmatch(r"/(pregame|core-game)/v1/players/([\w-]+)", path)
+            if match:
+                return 200, msgspec.json.encode(
+                    {"Subject": match[2], "MatchID": match_id_for(0), "Version": 1}
+                )
+
+        return 404, b'{"httpStatus": 404, "errorCode": "RESOURCE_NOT_FOUND"}'
+
+    def route_pd(self, path: str, query: dict) -> tuple[int, bytes]:
+        match = re.fullmatch(r"/match-details/v1/matches/([\w-]+)", path)
+        if match:
+            return 200, self.get_match(match[1])
+
+        match = re.fullmatch(r"/match-history/v1/history/([\w-]+)", path)
+        if match:
+            start = int(query.get("startIndex", ["0"])[0])
+            end = min(int(query.get("endIndex", ["20"])[0]), self.history_size)
+            return 200, msgspec.json.encode(
+                {
+                    "Subject": match[1],
+                    "BeginIndex": start,
+                    "EndIndex": end,
+                    "Total": self.history_size,
+                    "History": [
+                        {
+                            "MatchID": match_id_for(index),
+                            # newest first, one match per hour
+                            "GameStartTime": 1700000000000 - index * 3600000,
+                            "QueueID": "competitive",
+                        }
+                        for index in range(start, end)
+                    ],
+                }
+            )
+
+        return 404, b'{"httpStatus": 404, "errorCode": "RESOURCE_NOT_FOUND"}'
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+
+        headers = dict(scope["headers"])
+        host = headers.get(b"host", b"").decode().split(":")[0]
+        key = f"{scope['method']} {host}"
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        response_headers = [(b"content-type", b"application/json")]
+        if (host.startswith("pd.") or host.startswith("glz-")) and (
+            self.random.random() < self.error_rate
+        ):
+            status, body = self.error_status, b'{"errorCode": "INJECTED"}'
+            response_headers.append((b"retry-after", b"0"))
+        else:
+            status, body = self.route(
+                scope["method"],
+                host,
+                scope["path"],
+                parse_qs(scope["query_string"].decode()),
+            )
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": response_headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def mock_client(app: MockRiot, **limits) -> httpx.AsyncClient:
+    """
+    Returns a client that sends every request to ``app`` through the same
+    rate limiting and retry layer as the real client.
+    """
+
+    transport = RateLimitedTransport(
+        httpx.ASGITransport(app=app),
+        limits or {"auth": (1e6, 1000), "pd": (1e6, 1000), "glz": (1e6, 1000)},
+        backoff=0.01,
+    )
+    return httpx.AsyncClient(transport=transport)
@@ -1,11 +1,12 @@
-import msgspec.json
-import requests
+import asyncio
 
 from valorant import Valorant
-from valorant.structs.agent import AgentResponse
 
-valorant = Valorant("pitosexo69", "#Test12345")
 
-a = requests.get("https://valorant-api.com/v1/agents?isPlayableCharacter=true").content
+async def main():
+    valorant = Valorant("pitosexo69", "#Test12345")
+    print(await valorant.get_agents())
+    await valorant.close()
 
-print(msgspec.json.decode(a, type=AgentResponse))
+
+asyncio.run(main())
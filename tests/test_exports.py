@@ -0,0 +1,83 @@
+import importlib
+
+import pytest
+
+import valorant
+
+# every name ``from valorant import *`` provided before the exports were lazy
+OLD_NAMES = [
+    "Valorant",
+    "Auth",
+    "LockFile",
+    "get_jwt_expiry",
+    "URLS",
+    "API",
+    "Region",
+    "Regions",
+    "regions",
+    "xmpp_regions",
+    "xmpp_servers",
+    "Version",
+    "VersionResponse",
+    "Penalties",
+    "Config",
+    "VersionProvider",
+    "SessionContext",
+    "MatchCache",
+    "RateLimitedTransport",
+    "LeaderboardCrawler",
+    "Result",
+    "fetch_many",
+    "XMPP",
+    "AccountXP",
+    "AgentResponse",
+    "Content",
+    "Contracts",
+    "CurrentGameLoadouts",
+    "CurrentGameMatch",
+    "PlayerMatch",
+    "PregameLoadouts",
+    "PregameMatch",
+    "LeaderBoard",
+    "Loadout",
+    "MatchDetails",
+    "MatchInfo",
+    "MatchSummary",
+    "HistoryMatch",
+    "HistoryMatchResponse",
+    "PlayerMMR",
+    "OwnedItems",
+    "Prices",
+    "Storefront",
+    "Wallet",
+    "User",
+    "decode",
+    "CLIENT_PLATFORM",
+    "AsyncIterator",
+    "Iterable",
+    "ElementTree",
+    "Element",
+]
+
+
+@pytest.mark.parametrize("name", OLD_NAMES)
+def test_old_name_imports(name):
+    assert name in valorant.__all__
+    assert getattr(valorant, name) is not None
+    exec(f"from valorant import {name}", {})
+
+
+def test_exports_point_to_defining_modules():
+    for name, module in valorant._exports.items():
+        assert getattr(valorant, name) is getattr(importlib.import_module(module), name)
+
+
+def test_star_import():
+    namespace = {}
+    exec("from valorant import *", namespace)
+    assert {"MatchDetails", "User", "Valorant", "XMPP"} <= set(namespace)
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        valorant.NotAName
@@ -1,5 +1,94 @@
-from valorant.valorant import *
-from valorant.structs.structs import *
-from valorant.auth import *
-from valorant.constants import *
-from valorant.xmpp import *
+"""
+Valorant API wrapper and XMPP client
+
+The submodules are only imported when one of their names is first used, so
+``import valorant`` stays cheap for scripts that only need part of it.
+"""
+
+import importlib
+
+# public name -> module it is defined in
+_exports = {
+    "Valorant": "valorant.valorant",
+    "SessionPool": "valorant.pool",
+    "Auth": "valorant.auth",
+    "LockFile": "valorant.auth",
+    "get_jwt_expiry": "valorant.auth",
+    "URLS": "valorant.constants",
+    "API": "valorant.constants",
+    "Region": "valorant.constants",
+    "Regions": "valorant.constants",
+    "regions": "valorant.constants",
+    "xmpp_regions": "valorant.constants",
+    "xmpp_servers": "valorant.constants",
+    "Version": "valorant.structs.structs",
+    "VersionResponse": "valorant.structs.structs",
+    "Penalties": "valorant.structs.structs",
+    "Config": "valorant.structs.structs",
+    "VersionProvider": "valorant.version",
+    "SessionContext": "valorant.session",
+    "MatchCache": "valorant.cache",
+    "MatchStore": "valorant.database",
+    "RateLimitedTransport": "valorant.ratelimit",
+    "LeaderboardCrawler": "valorant.crawler",
+    "MatchHistorySync": "valorant.sync",
+    "Result": "valorant.concurrency",
+    "fetch_many": "valorant.concurrency",
+    "XMPP": "valorant.xmpp",
+    "IQError": "valorant.xmpp",
+    "XMPPManager": "valorant.xmpp_manager",
+    "PresenceStore": "valorant.presence",
+    "AccountXP": "valorant.structs.account",
+    "AgentResponse": "valorant.structs.agent",
+    "Content": "valorant.structs.content",
+    "Contracts": "valorant.structs.contract",
+    "CurrentGameLoadouts": "valorant.structs.game",
+    "CurrentGameMatch": "valorant.structs.game",
+    "PlayerMatch": "valorant.structs.game",
+    "PregameLoadouts": "valorant.structs.game",
+    "PregameMatch": "valorant.structs.game",
+    "LeaderBoard": "valorant.structs.leaderboard",
+    "Loadout": "valorant.structs.loadout",
+    "MatchDetails": "valorant.structs.match",
+    "MatchInfo": "valorant.structs.match",
+    "MatchSummary": "valorant.structs.match",
+    "HistoryMatch": "valorant.structs.match",
+    "HistoryMatchResponse": "valorant.structs.match",
+    "PlayerMMR": "valorant.structs.mmr",
+    "OwnedItems": "valorant.structs.store",
+    "Prices": "valorant.structs.store",
+    "Storefront": "valorant.structs.store",
+    "Wallet": "valorant.structs.store",
+    "User": "valorant.structs.user",
+    "decode": "valorant.decoding",
+    "CLIENT_PLATFORM": "valorant.session",
+    # leaked by the star imports this module used to do, kept so code
+    # relying on them keeps working
+    "AsyncIterator": "typing",
+    "Iterable": "typing",
+    "ElementTree": "xml.etree",
+    "Element": "xml.etree.ElementTree",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str):
+    module = _exports.get(name)
+    if module is None:
+        try:
+            # lets valorant.<submodule> work without importing it first
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
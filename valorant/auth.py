@@ -1,9 +1,16 @@
+import asyncio
+import base64
+import json
+import logging
 import os
+import time
 
 import httpx
 
 from valorant.constants import URLS
 
+logger = logging.getLogger(__name__)
+
 
 class LockFile:
     def __init__(self, lockfile_path: str = None) -> None:
@@ -19,17 +26,60 @@ class LockFile:
             )
 
 
+def get_jwt_expiry(token: str) -> float | None:
+    """Returns the ``exp`` claim of a JWT as a unix timestamp, if it has one."""
+
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
 class Auth:
-    def __init__(self, client: httpx.AsyncClient, username: str, password: str) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        username: str,
+        password: str,
+        refresh_margin: float = 300,
+        auto_refresh: bool = True,
+        refresh_retry_interval: float = 60,
+    ) -> None:
+        """
+        :param refresh_margin: seconds before expiry at which a token is
+            considered stale and refreshed
+        :param auto_refresh: refresh the access token in the background before
+            it expires instead of on the first call after it went stale
+        :param refresh_retry_interval: seconds between attempts when a
+            background refresh fails
+        """
+
         self.client = client
 
         self.username = username
         self.password = password
 
+        self.refresh_margin = refresh_margin
+        self.auto_refresh = auto_refresh
+        self.refresh_retry_interval = refresh_retry_interval
+
         self.__access_token = None
         self.__id_token = None
+        self.__access_token_expiry = 0.0
         self.__entitlement_token = None
+        self.__entitlement_token_expiry = 0.0
         self.__pas_token = None
+        self.__pas_token_expiry = 0.0
+
+        self.__access_lock = asyncio.Lock()
+        self.__entitlement_lock = asyncio.Lock()
+        self.__pas_lock = asyncio.Lock()
+        self.__refresh_task: asyncio.Task | None = None
+
+    def _is_fresh(self, token: str | None, expiry: float) -> bool:
+        return token is not None and time.time() < expiry - self.refresh_margin
 
     async def set_auth_cookies(self) -> None:
         await self.client.post(
@@ -45,10 +95,7 @@ class Auth:
             },
         )
 
-    async def get_access_token(self) -> str:
-        if self.__access_token is not None:
-            return self.__access_token
-
+    async def _login(self) -> None:
         request = (
             await self.client.put(
                 url=URLS.AUTH_URL,
@@ -65,6 +112,11 @@ class Auth:
         if request["type"] == "multifactor":
             raise ValueError("Multifactor needed, please disable it and try again")
 
+        if request["type"] != "response":
+            raise ValueError(
+                f"Authentication failed: {request.get('error', request['type'])}"
+            )
+
         tokens = dict(
             map(
                 lambda x: x.split("="),
@@ -76,40 +128,129 @@ class Auth:
             tokens["access_token"],
             tokens["id_token"],
         )
-        return self.__access_token
+        self.__access_token_expiry = get_jwt_expiry(self.__access_token) or (
+            time.time() + int(tokens.get("expires_in", 3600))
+        )
 
-    async def get_id_token(self) -> str:
-        if self.__id_token is not None:
-            return self.__id_token
+        # both are issued for a specific access token
+        self.__entitlement_token = None
+        self.__pas_token = None
+
+        if self.auto_refresh:
+            self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        if self.__refresh_task is not None and not self.__refresh_task.done():
+            if self.__refresh_task is not asyncio.current_task():
+                self.__refresh_task.cancel()
+
+        self.__refresh_task = asyncio.create_task(
+            self._refresh_later(self.__access_token, self.__access_token_expiry)
+        )
+
+    async def _refresh_later(self, access_token: str, expiry: float) -> None:
+        await asyncio.sleep(max(0.0, expiry - self.refresh_margin - time.time()))
+        while True:
+            try:
+                # a successful login schedules the next refresh itself
+                await self.refresh(access_token)
+                await self.get_entitlement_token()
+                return
+            except Exception:
+                # e.g. a network error or an unexpected auth response
+                logger.exception("Refreshing the tokens of %s failed", self.username)
 
-        self.__access_token, self.__id_token = await self.get_access_token()
+            await asyncio.sleep(self.refresh_retry_interval)
+            if self.__refresh_task is not asyncio.current_task():
+                # a caller logged in meanwhile and scheduled a new refresh
+                return
+
+    async def refresh(self, stale_access_token: str | None = None) -> str:
+        """
+        Logs in again and returns the new access token.
+
+        If ``stale_access_token`` is given and the current token is already a
+        different one, another caller refreshed it in the meantime and no new
+        login is made, so concurrent callers share a single refresh.
+        """
+
+        async with self.__access_lock:
+            if stale_access_token is None or stale_access_token == self.__access_token:
+                await self.set_auth_cookies()
+                await self._login()
+
+            return self.__access_token
+
+    async def get_access_token(self) -> str:
+        if self._is_fresh(self.__access_token, self.__access_token_expiry):
+            return self.__access_token
+
+        async with self.__access_lock:
+            if not self._is_fresh(self.__access_token, self.__access_token_expiry):
+                await self._login()
+
+            return self.__access_token
+
+    async def get_id_token(self) -> str:
+        await self.get_access_token()
         return self.__id_token
 
     async def get_entitlement_token(self) -> str:
-        if self.__entitlement_token is not None:
+        if self._is_fresh(self.__entitlement_token, self.__entitlement_token_expiry):
             return self.__entitlement_token
 
-        self.__entitlement_token = (
-            await self.client.post(
-                URLS.ENTITLEMENT_URL,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {await self.get_access_token()}",
-                },
-                json={},
-            )
-        ).json()["entitlements_token"]
+        async with self.__entitlement_lock:
+            if self._is_fresh(
+                self.__entitlement_token, self.__entitlement_token_expiry
+            ):
+                return self.__entitlement_token
+
+            self.__entitlement_token = (
+                await self.client.post(
+                    URLS.ENTITLEMENT_URL,
+                    headers={
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {await self.get_access_token()}",
+                    },
+                    json={},
+                )
+            ).json()["entitlements_token"]
+            self.__entitlement_token_expiry = get_jwt_expiry(
+                self.__entitlement_token
+            ) or min(self.__access_token_expiry, time.time() + 3600)
 
         return self.__entitlement_token
 
     async def get_pas_token(self) -> str:
-        if self.__pas_token is not None:
+        if self._is_fresh(self.__pas_token, self.__pas_token_expiry):
             return self.__pas_token
 
-        self.__pas_token = (
-            await self.client.get(
-                "https://riot-geo.pas.si.riotgames.com/pas/v1/service/chat",
-                headers={"Authorization": f"Bearer {await self.get_access_token()}"},
+        async with self.__pas_lock:
+            if self._is_fresh(self.__pas_token, self.__pas_token_expiry):
+                return self.__pas_token
+
+            self.__pas_token = (
+                await self.client.get(
+                    "https://riot-geo.pas.si.riotgames.com/pas/v1/service/chat",
+                    headers={
+                        "Authorization": f"Bearer {await self.get_access_token()}"
+                    },
+                )
+            ).text
+            self.__pas_token_expiry = get_jwt_expiry(self.__pas_token) or min(
+                self.__access_token_expiry, time.time() + 3600
             )
-        ).text
+
         return self.__pas_token
+
+    async def close(self) -> None:
+        """Stops the background refresh task."""
+
+        if self.__refresh_task is not None:
+            self.__refresh_task.cancel()
+            try:
+                await self.__refresh_task
+            except asyncio.CancelledError:
+                pass
+
+            self.__refresh_task = None
@@ -0,0 +1,109 @@
+"""
+Persistent on-disk cache for finished match payloads
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+
+class MatchCache:
+    """
+    A size bounded LRU cache of raw match detail payloads keyed by match ID.
+
+    Entries are stored in a SQLite database in WAL mode, so several processes
+    on the same host can share one cache file. Only finished matches should
+    be stored, their payload never changes.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+
+        # the connection is shared by the threads of aget/aput
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS matches ("
+            "match_id TEXT PRIMARY KEY, "
+            "payload BLOB NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "accessed_at REAL NOT NULL)"
+        )
+        self.__connection.execute(
+            "CREATE INDEX IF NOT EXISTS matches_accessed_at ON matches (accessed_at)"
+        )
+
+    def get(self, match_id: str) -> bytes | None:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT payload FROM matches WHERE match_id = ?", (match_id,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.__connection.execute(
+                "UPDATE matches SET accessed_at = ? WHERE match_id = ?",
+                (time.time(), match_id),
+            )
+            return row[0]
+
+    def put(self, match_id: str, payload: bytes) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute("BEGIN IMMEDIATE")
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?)",
+                (match_id, payload, len(payload), time.time()),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        (total,) = self.__connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM matches"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        # drop the least recently used entries until the cache fits again
+        for match_id, size in self.__connection.execute(
+            "SELECT match_id, size FROM matches ORDER BY accessed_at"
+        ).fetchall():
+            self.__connection.execute(
+                "DELETE FROM matches WHERE match_id = ?", (match_id,)
+            )
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def __contains__(self, match_id: str) -> bool:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT 1 FROM matches WHERE match_id = ?", (match_id,)
+            ).fetchone()
+
+        return row is not None
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute(
+                "SELECT COUNT(*) FROM matches"
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__connection.execute("DELETE FROM matches")
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    async def aget(self, match_id: str) -> bytes | None:
+        return await asyncio.to_thread(self.get, match_id)
+
+    async def aput(self, match_id: str, payload: bytes) -> None:
+        await asyncio.to_thread(self.put, match_id, payload)
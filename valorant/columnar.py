@@ -0,0 +1,254 @@
+"""
+Flattens match details into columnar NumPy arrays for vectorized analysis
+
+Requires the ``analytics`` extra (``pip install valapi.py[analytics]``).
+"""
+
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from valorant.structs.match import MatchDetails
+
+# column name -> dtype, per table
+SCHEMA = {
+    "matches": {
+        "match": "int32",
+        "map": "int32",
+        "queue": "int32",
+        "season": "int32",
+        "start": "int64",
+        "duration": "int64",
+        "is_ranked": "bool",
+    },
+    "players": {
+        "match": "int32",
+        "player": "int32",
+        "team": "int32",
+        "agent": "int32",
+        "rank": "int16",
+        "score": "int32",
+        "kills": "int16",
+        "deaths": "int16",
+        "assists": "int16",
+    },
+    "player_stats": {
+        "match": "int32",
+        "round": "int16",
+        "player": "int32",
+        "score": "int32",
+        "kills": "int16",
+        "afk": "bool",
+        "penalized": "bool",
+    },
+    "kills": {
+        "match": "int32",
+        "round": "int16",
+        "game_time": "int64",
+        "round_time": "int32",
+        "killer": "int32",
+        "victim": "int32",
+        "weapon": "int32",
+        "damage_type": "int32",
+        "victim_x": "float32",
+        "victim_y": "float32",
+        "assists": "int8",
+    },
+    "damage": {
+        "match": "int32",
+        "round": "int16",
+        "player": "int32",
+        "receiver": "int32",
+        "damage": "int32",
+        "legshots": "int16",
+        "bodyshots": "int16",
+        "headshots": "int16",
+    },
+    "economy": {
+        "match": "int32",
+        "round": "int16",
+        "player": "int32",
+        "loadout_value": "int32",
+        "weapon": "int32",
+        "armor": "int32",
+        "remaining": "int32",
+        "spent": "int32",
+    },
+}
+
+
+class Categories:
+    """Assigns consecutive integer codes to the distinct values of a column."""
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class MatchColumns:
+    """
+    Columnar tables built by :func:`to_columns`.
+
+    ID columns hold integer codes, ``decode("player", codes)`` turns them back
+    into the original IDs. The ``match``, ``player``, ``agent``, ``weapon``
+    (weapons and armor), ``map``, ``queue``, ``season``, ``team`` and
+    ``damage_type`` categories are shared by every table.
+    """
+
+    def __init__(
+        self, tables: dict[str, dict[str, "np.ndarray"]], categories: dict[str, list]
+    ) -> None:
+        self.tables = tables
+        self.categories = categories
+
+    def __getitem__(self, table: str) -> dict[str, "np.ndarray"]:
+        return self.tables[table]
+
+    def decode(self, category: str, codes: "np.ndarray") -> "np.ndarray":
+        return np.asarray(self.categories[category], dtype=object)[codes]
+
+
+def to_columns(matches: Iterable[MatchDetails]) -> MatchColumns:
+    """Flattens a batch of matches into one set of columnar tables."""
+
+    if np is None:
+        raise ImportError(
+            "numpy is required for columnar export, "
+            "install it with `pip install valapi.py[analytics]`"
+        )
+
+    categories = {
+        name: Categories()
+        for name in (
+            "match",
+            "player",
+            "agent",
+            "weapon",
+            "map",
+            "queue",
+            "season",
+            "team",
+            "damage_type",
+        )
+    }
+    match_code = categories["match"].encode
+    player = categories["player"].encode
+    weapon = categories["weapon"].encode
+    rows = {
+        table: {column: [] for column in columns} for table, columns in SCHEMA.items()
+    }
+
+    def append(table: str, *values) -> None:
+        for column, value in zip(rows[table].values(), values):
+            column.append(value)
+
+    for match in matches:
+        info = match.info
+        m = match_code(info.id)
+        append(
+            "matches",
+            m,
+            categories["map"].encode(info.map_id),
+            categories["queue"].encode(info.queue_id),
+            categories["season"].encode(info.season_id),
+            info.game_start_millis,
+            info.duration or 0,
+            info.is_ranked,
+        )
+
+        for game_player in match.players:
+            stats = game_player.stats
+            append(
+                "players",
+                m,
+                player(game_player.player_id),
+                categories["team"].encode(game_player.team),
+                categories["agent"].encode(game_player.character_id),
+                game_player.rank,
+                stats.score if stats else 0,
+                stats.kills if stats else 0,
+                stats.deaths if stats else 0,
+                stats.assists if stats else 0,
+            )
+
+        for round_ in match.rounds or ():
+            r = round_.number
+            for stats in round_.player_stats:
+                p = player(stats.player_id)
+                append(
+                    "player_stats",
+                    m,
+                    r,
+                    p,
+                    stats.score,
+                    len(stats.kills),
+                    stats.afk,
+                    stats.penalized,
+                )
+
+                for kill in stats.kills:
+                    append(
+                        "kills",
+                        m,
+                        r,
+                        kill.game_time,
+                        kill.round_time,
+                        player(kill.killer_id),
+                        player(kill.victim_id),
+                        weapon(kill.finishing_damage.item),
+                        categories["damage_type"].encode(kill.finishing_damage.type),
+                        kill.victim_location.x,
+                        kill.victim_location.y,
+                        len(kill.assistants),
+                    )
+
+                for damage in stats.damage:
+                    append(
+                        "damage",
+                        m,
+                        r,
+                        p,
+                        player(damage.receiver_id),
+                        damage.damage,
+                        damage.legshots,
+                        damage.bodyshots,
+                        damage.headshots,
+                    )
+
+                economy = stats.economy
+                append(
+                    "economy",
+                    m,
+                    r,
+                    p,
+                    economy.credits,
+                    weapon(economy.weapon_id),
+                    weapon(economy.armor_id),
+                    economy.remaining,
+                    economy.spent,
+                )
+
+    tables = {
+        table: {
+            column: np.asarray(rows[table][column], dtype=dtype)
+            for column, dtype in columns.items()
+        }
+        for table, columns in SCHEMA.items()
+    }
+    return MatchColumns(
+        tables, {name: category.values for name, category in categories.items()}
+    )
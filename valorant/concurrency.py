@@ -0,0 +1,103 @@
+"""
+Helpers to run many API calls concurrently
+"""
+
+import asyncio
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class Result(Generic[K, V]):
+    """The outcome of fetching a single key, either a value or an error."""
+
+    __slots__ = ("key", "value", "error")
+
+    def __init__(
+        self, key: K, value: V | None = None, error: Exception | None = None
+    ) -> None:
+        self.key = key
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> V:
+        """Returns the value, raising the error if the fetch failed."""
+
+        if self.error is not None:
+            raise self.error
+
+        return self.value
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"Result({self.key!r}, error={self.error!r})"
+
+        return f"Result({self.key!r}, {self.value!r})"
+
+
+async def fetch_many(
+    keys: Iterable[K],
+    fetch: Callable[[K], Awaitable[V]],
+    concurrency: int = 10,
+    ordered: bool = False,
+) -> AsyncIterator[Result[K, V]]:
+    """
+    Calls ``fetch`` for every unique key with at most ``concurrency`` calls in
+    flight and yields a :class:`Result` per key.
+
+    Results are yielded as they complete, or in the order of ``keys`` if
+    ``ordered`` is set. A failing key is reported through its result and
+    does not stop the rest of the batch.
+    """
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    keys = list(dict.fromkeys(keys))
+    pending = iter(enumerate(keys))
+    results: asyncio.Queue[tuple[int, Result[K, V]]] = asyncio.Queue()
+
+    async def worker() -> None:
+        # the workers share one iterator, so each key is fetched exactly once
+        for index, key in pending:
+            try:
+                result = Result(key, await fetch(key))
+            except Exception as error:
+                result = Result(key, error=error)
+
+            results.put_nowait((index, result))
+
+    workers = [
+        asyncio.create_task(worker()) for _ in range(min(concurrency, len(keys)))
+    ]
+    try:
+        buffered: dict[int, Result[K, V]] = {}
+        next_index = 0
+        for _ in range(len(keys)):
+            index, result = await results.get()
+            if not ordered:
+                yield result
+                continue
+
+            buffered[index] = result
+            while next_index in buffered:
+                yield buffered.pop(next_index)
+                next_index += 1
+    finally:
+        for task in workers:
+            task.cancel()
+
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -4,6 +4,8 @@ class URLS:
     VERIFIED_URL = "https://email-verification.riotgames.com/api/v1/account/status"
     ENTITLEMENT_URL = "https://entitlements.auth.riotgames.com/api/token/v1"
     USERINFO_URL = "https://auth.riotgames.com/userinfo"
+    VERSION_URL = "https://valorant-api.com/v1/version"
+    AGENTS_URL = "https://valorant-api.com/v1/agents"
 
 
 class API:
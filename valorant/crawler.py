@@ -0,0 +1,63 @@
+"""
+Crawlers for endpoints that are paginated by index
+"""
+
+from typing import TYPE_CHECKING, AsyncIterator
+
+from valorant.concurrency import fetch_many
+from valorant.structs.leaderboard import LeaderBoard, LeaderBoardPlayer
+
+if TYPE_CHECKING:
+    from valorant.valorant import Valorant
+
+
+class LeaderboardCrawler:
+    """
+    Crawls every page of a season leaderboard concurrently.
+
+    The first page is fetched alone to learn ``total_players``, the remaining
+    windows are fetched with at most ``concurrency`` requests in flight and
+    yielded in order. If the crawl fails, iterating again resumes from
+    ``next_index``, the first window that was not yielded yet.
+    """
+
+    def __init__(
+        self,
+        valorant: "Valorant",
+        season_id: str,
+        page_size: int = 510,
+        concurrency: int = 5,
+        start: int = 0,
+    ) -> None:
+        self.valorant = valorant
+        self.season_id = season_id
+        self.page_size = page_size
+        self.concurrency = concurrency
+
+        self.next_index = start
+        self.total_players: int | None = None
+
+    async def _get_page(self, start: int) -> LeaderBoard:
+        return await self.valorant.get_leaderboard(
+            self.season_id, start, self.page_size
+        )
+
+    async def crawl(self) -> AsyncIterator[list[LeaderBoardPlayer]]:
+        first = await self._get_page(self.next_index)
+        self.total_players = first.total_players
+        if not first.players:
+            return
+
+        self.next_index += self.page_size
+        yield first.players
+
+        windows = range(self.next_index, self.total_players, self.page_size)
+        async for result in fetch_many(
+            windows, self._get_page, self.concurrency, ordered=True
+        ):
+            players = result.unwrap().players
+            self.next_index = result.key + self.page_size
+            yield players
+
+    def __aiter__(self) -> AsyncIterator[list[LeaderBoardPlayer]]:
+        return self.crawl()
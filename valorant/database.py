@@ -0,0 +1,360 @@
+"""
+Local SQLite store of match details with indexed lookups
+"""
+
+import asyncio
+import itertools
+import sqlite3
+import threading
+from typing import Iterable
+
+import msgspec.json
+
+from valorant.decoding import decode
+from valorant.structs.match import MatchDetails
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS matches ("
+    "match_id TEXT PRIMARY KEY, "
+    "map_id TEXT NOT NULL, "
+    "queue_id TEXT NOT NULL, "
+    "season_id TEXT NOT NULL, "
+    "game_mode TEXT NOT NULL, "
+    "is_ranked INTEGER NOT NULL, "
+    "start_millis INTEGER NOT NULL, "
+    "duration INTEGER, "
+    "completion_state TEXT NOT NULL, "
+    "payload BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS match_players ("
+    "match_id TEXT NOT NULL REFERENCES matches (match_id) ON DELETE CASCADE, "
+    "player_id TEXT NOT NULL, "
+    "team TEXT NOT NULL, "
+    "party_id TEXT NOT NULL, "
+    "character_id TEXT NOT NULL, "
+    "rank INTEGER NOT NULL, "
+    "won INTEGER, "
+    "score INTEGER, "
+    "kills INTEGER, "
+    "deaths INTEGER, "
+    "assists INTEGER, "
+    "PRIMARY KEY (match_id, player_id))",
+    "CREATE TABLE IF NOT EXISTS rounds ("
+    "match_id TEXT NOT NULL REFERENCES matches (match_id) ON DELETE CASCADE, "
+    "number INTEGER NOT NULL, "
+    "result TEXT NOT NULL, "
+    "winning_team TEXT NOT NULL, "
+    "site TEXT NOT NULL, "
+    "planter_id TEXT, "
+    "defuser_id TEXT, "
+    "PRIMARY KEY (match_id, number))",
+    "CREATE TABLE IF NOT EXISTS kills ("
+    "match_id TEXT NOT NULL REFERENCES matches (match_id) ON DELETE CASCADE, "
+    "round INTEGER, "
+    "game_time INTEGER NOT NULL, "
+    "round_time INTEGER NOT NULL, "
+    "killer_id TEXT NOT NULL, "
+    "victim_id TEXT NOT NULL, "
+    "weapon TEXT NOT NULL, "
+    "damage_type TEXT NOT NULL, "
+    "victim_x REAL NOT NULL, "
+    "victim_y REAL NOT NULL, "
+    "assists INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS match_players_player_id ON match_players (player_id)",
+    "CREATE INDEX IF NOT EXISTS matches_map_id ON matches (map_id)",
+    "CREATE INDEX IF NOT EXISTS matches_queue_id ON matches (queue_id)",
+    "CREATE INDEX IF NOT EXISTS matches_season_id ON matches (season_id)",
+    "CREATE INDEX IF NOT EXISTS matches_start_millis ON matches (start_millis)",
+    "CREATE INDEX IF NOT EXISTS kills_match_id ON kills (match_id)",
+    "CREATE INDEX IF NOT EXISTS kills_killer_id ON kills (killer_id)",
+)
+
+
+class MatchStore:
+    """
+    Persists match details in normalized, indexed tables.
+
+    Every match is stored with its players, rounds and kills, next to the
+    encoded match itself so queries return :class:`MatchDetails` again.
+    The database is in WAL mode, readers are not blocked while a batch is
+    being written.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        # the connection is shared by the threads of the async methods
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute("PRAGMA foreign_keys=ON")
+        for statement in SCHEMA:
+            self.__connection.execute(statement)
+
+    def add(self, match: MatchDetails) -> None:
+        self.add_many((match,))
+
+    def add_many(self, matches: Iterable[MatchDetails], batch_size: int = 100) -> int:
+        """
+        Stores matches, replacing ones already stored, with one transaction per
+        ``batch_size`` matches. Returns the number of matches stored.
+        """
+
+        count = 0
+        matches = iter(matches)
+        while batch := list(itertools.islice(matches, batch_size)):
+            self._insert(batch)
+            count += len(batch)
+
+        return count
+
+    def _insert(self, matches: list[MatchDetails]) -> None:
+        match_rows = []
+        player_rows = []
+        round_rows = []
+        kill_rows = []
+
+        # the last copy of a match wins, like it would across batches
+        for match in {match.info.id: match for match in matches}.values():
+            info = match.info
+            match_rows.append(
+                (
+                    info.id,
+                    info.map_id,
+                    info.queue_id,
+                    info.season_id,
+                    info.game_mode,
+                    info.is_ranked,
+                    info.game_start_millis,
+                    info.duration,
+                    info.completion_state,
+                    msgspec.json.encode(match),
+                )
+            )
+
+            won = {team.team: team.won for team in match.teams or ()}
+            for player in match.players:
+                stats = player.stats
+                player_rows.append(
+                    (
+                        info.id,
+                        player.player_id,
+                        player.team,
+                        player.party_id,
+                        player.character_id,
+                        player.rank,
+                        won.get(player.team),
+                        stats and stats.score,
+                        stats and stats.kills,
+                        stats and stats.deaths,
+                        stats and stats.assists,
+                    )
+                )
+
+            if match.rounds is None:
+                # without rounds the kills can not be assigned to one
+                kills = ((None, kill) for kill in match.kills)
+            else:
+                kills = (
+                    (round_.number, kill)
+                    for round_ in match.rounds
+                    for stats in round_.player_stats
+                    for kill in stats.kills
+                )
+
+            for round_ in match.rounds or ():
+                round_rows.append(
+                    (
+                        info.id,
+                        round_.number,
+                        round_.result,
+                        round_.who_won,
+                        round_.site,
+                        round_.bomb_planter_id,
+                        round_.bomb_defuser_id,
+                    )
+                )
+
+            for number, kill in kills:
+                kill_rows.append(
+                    (
+                        info.id,
+                        number,
+                        kill.game_time,
+                        kill.round_time,
+                        kill.killer_id,
+                        kill.victim_id,
+                        kill.finishing_damage.item,
+                        kill.finishing_damage.type,
+                        kill.victim_location.x,
+                        kill.victim_location.y,
+                        len(kill.assistants),
+                    )
+                )
+
+        with self.__lock, self.__connection:
+            self.__connection.execute("BEGIN IMMEDIATE")
+            # replacing a match cascades to its players, rounds and kills
+            self.__connection.executemany(
+                "DELETE FROM matches WHERE match_id = ?",
+                [(row[0],) for row in match_rows],
+            )
+            self.__connection.executemany(
+                "INSERT INTO matches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", match_rows
+            )
+            self.__connection.executemany(
+                "INSERT INTO match_players VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                player_rows,
+            )
+            self.__connection.executemany(
+                "INSERT INTO rounds VALUES (?, ?, ?, ?, ?, ?, ?)", round_rows
+            )
+            self.__connection.executemany(
+                "INSERT INTO kills VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                kill_rows,
+            )
+
+    def _select(
+        self,
+        columns: str,
+        player_id: str | None,
+        map_id: str | None,
+        queue_id: str | None,
+        season_id: str | None,
+        since: int | None,
+        until: int | None,
+        limit: int | None,
+    ) -> list[tuple]:
+        query = f"SELECT {columns} FROM matches"
+        conditions = []
+        parameters = []
+
+        if player_id is not None:
+            # a player is in few matches, CROSS JOIN makes SQLite start from
+            # their rows instead of scanning e.g. a whole queue
+            query = (
+                f"SELECT {columns} FROM match_players"
+                " CROSS JOIN matches USING (match_id)"
+            )
+            conditions.append("match_players.player_id = ?")
+            parameters.append(player_id)
+
+        for column, value in (
+            ("map_id", map_id),
+            ("queue_id", queue_id),
+            ("season_id", season_id),
+        ):
+            if value is not None:
+                conditions.append(f"matches.{column} = ?")
+                parameters.append(value)
+
+        if since is not None:
+            conditions.append("matches.start_millis >= ?")
+            parameters.append(since)
+
+        if until is not None:
+            conditions.append("matches.start_millis < ?")
+            parameters.append(until)
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY matches.start_millis DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+
+        with self.__lock:
+            return self.__connection.execute(query, parameters).fetchall()
+
+    def find_match_ids(
+        self,
+        player_id: str | None = None,
+        map_id: str | None = None,
+        queue_id: str | None = None,
+        season_id: str | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        limit: int | None = None,
+    ) -> list[str]:
+        """Like :meth:`find_matches` but only returns the match IDs."""
+
+        rows = self._select(
+            "matches.match_id",
+            player_id,
+            map_id,
+            queue_id,
+            season_id,
+            since,
+            until,
+            limit,
+        )
+        return [match_id for (match_id,) in rows]
+
+    def find_matches(
+        self,
+        player_id: str | None = None,
+        map_id: str | None = None,
+        queue_id: str | None = None,
+        season_id: str | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        limit: int | None = None,
+    ) -> list[MatchDetails]:
+        """
+        Returns the stored matches matching every given filter, newest first.
+
+        :param player_id: matches this player took part in
+        :param since: matches started at or after this unix timestamp in
+            milliseconds
+        :param until: matches started before this unix timestamp in
+            milliseconds
+        """
+
+        rows = self._select(
+            "matches.payload",
+            player_id,
+            map_id,
+            queue_id,
+            season_id,
+            since,
+            until,
+            limit,
+        )
+        return [decode(payload, MatchDetails) for (payload,) in rows]
+
+    def get(self, match_id: str) -> MatchDetails | None:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT payload FROM matches WHERE match_id = ?", (match_id,)
+            ).fetchone()
+
+        return None if row is None else decode(row[0], MatchDetails)
+
+    def __contains__(self, match_id: str) -> bool:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT 1 FROM matches WHERE match_id = ?", (match_id,)
+            ).fetchone()
+
+        return row is not None
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM matches").fetchone()[
+                0
+            ]
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    async def aadd_many(
+        self, matches: Iterable[MatchDetails], batch_size: int = 100
+    ) -> int:
+        return await asyncio.to_thread(self.add_many, list(matches), batch_size)
+
+    async def afind_matches(self, **filters) -> list[MatchDetails]:
+        return await asyncio.to_thread(lambda: self.find_matches(**filters))
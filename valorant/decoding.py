@@ -0,0 +1,21 @@
+"""
+Shared JSON decoders for the response structs
+"""
+
+import functools
+from typing import Type, TypeVar
+
+import msgspec.json
+
+T = TypeVar("T")
+
+
+@functools.cache
+def get_decoder(type: Type[T]) -> msgspec.json.Decoder:
+    """Returns a decoder for ``type``, created once and reused by every call."""
+
+    return msgspec.json.Decoder(type)
+
+
+def decode(content: bytes | str, type: Type[T]) -> T:
+    return get_decoder(type).decode(content)
@@ -0,0 +1,130 @@
+"""
+Many authenticated accounts sharing one connection pool
+"""
+
+import asyncio
+from typing import AsyncIterator, Iterable
+
+import httpx
+
+from valorant.cache import MatchCache
+from valorant.concurrency import Result, fetch_many
+from valorant.ratelimit import RateLimitedTransport
+from valorant.structs.match import (
+    HistoryMatchResponse,
+    MatchDetails,
+    MatchSummary,
+)
+from valorant.structs.structs import Version
+from valorant.valorant import Valorant
+from valorant.version import VersionProvider
+
+
+class SessionPool:
+    """
+    Manages many :class:`Valorant` sessions over one shared transport.
+
+    Every account gets its own client, so cookies and tokens stay isolated,
+    but all of them send their requests through the same connection pool and
+    rate limiter. Read-only calls that do not depend on the account, such as
+    match details, are spread over the sessions round-robin.
+    """
+
+    def __init__(
+        self,
+        rate_limits: dict[str, tuple[float, int] | None] | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 30.0,
+        http2: bool = False,
+        timeout: float | httpx.Timeout | None = 10.0,
+        client_version: Version | None = None,
+        version_refresh_interval: float | None = 3600,
+        match_cache: MatchCache | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        :param transport: a transport to share instead of building one from the
+            pool and rate limit options
+        """
+
+        if transport is None:
+            transport = RateLimitedTransport(
+                httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_keepalive_connections,
+                        keepalive_expiry=keepalive_expiry,
+                    ),
+                    http2=http2,
+                ),
+                rate_limits,
+            )
+
+        self.transport = transport
+        self.timeout = timeout
+        self.match_cache = match_cache
+
+        # used for account independent lookups like the client version
+        self.client = httpx.AsyncClient(transport=transport, timeout=timeout)
+        self.versions = VersionProvider(
+            self.client, version_refresh_interval, client_version
+        )
+
+        self.sessions: list[Valorant] = []
+        self.__next = 0
+
+    def add(self, username: str, password: str) -> Valorant:
+        session = Valorant(
+            username,
+            password,
+            client=httpx.AsyncClient(transport=self.transport, timeout=self.timeout),
+            match_cache=self.match_cache,
+            versions=self.versions,
+        )
+        self.sessions.append(session)
+        return session
+
+    async def start(self, concurrency: int = 10) -> None:
+        """Starts and authenticates every session, ``concurrency`` at a time."""
+
+        async def start(session: Valorant) -> None:
+            await session.start()
+            await session.get_session()
+
+        async for result in fetch_many(self.sessions, start, concurrency):
+            result.unwrap()
+
+    def acquire(self) -> Valorant:
+        """Returns the next session in round-robin order."""
+
+        if not self.sessions:
+            raise ValueError("The pool has no sessions, add one with add()")
+
+        session = self.sessions[self.__next % len(self.sessions)]
+        self.__next += 1
+        return session
+
+    async def get_match_history_page(
+        self, player_id: str, start: int = 0, end: int = 20
+    ) -> HistoryMatchResponse:
+        return await self.acquire().get_match_history_page(player_id, start, end)
+
+    async def get_match_details(self, match_id: str) -> MatchDetails:
+        return await self.acquire().get_match_details(match_id)
+
+    async def get_match_summary(self, match_id: str) -> MatchSummary:
+        return await self.acquire().get_match_summary(match_id)
+
+    def get_match_details_many(
+        self, match_ids: Iterable[str], concurrency: int = 10, ordered: bool = False
+    ) -> AsyncIterator[Result[str, MatchDetails]]:
+        """Like :meth:`Valorant.get_match_details_many`, spread over every session."""
+
+        return fetch_many(match_ids, self.get_match_details, concurrency, ordered)
+
+    async def close(self) -> None:
+        await asyncio.gather(*(session.close() for session in self.sessions))
+        await self.versions.close()
+        # closing any client closes the shared transport, so it is done once
+        await self.client.aclose()
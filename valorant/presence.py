@@ -0,0 +1,187 @@
+"""
+Latest presence of every contact, indexed by PUUID and resource
+"""
+
+import base64
+import binascii
+import time
+from typing import Callable, Iterator
+from xml.etree.ElementTree import Element
+
+import msgspec
+
+from valorant.decoding import decode
+from valorant.structs.presence import SessionLoopState, ValorantPresence
+
+
+class Presence:
+    """
+    The latest presence stanza of one contact.
+
+    The Valorant payload is kept as the raw base64 text and only decoded the
+    first time :attr:`valorant` is read.
+    """
+
+    __slots__ = (
+        "puuid",
+        "resource",
+        "show",
+        "payload",
+        "digest",
+        "updated_at",
+        "__valorant",
+    )
+
+    def __init__(
+        self, puuid: str, resource: str, show: str, payload: str | None, digest: int
+    ) -> None:
+        self.puuid = puuid
+        self.resource = resource
+        self.show = show
+        self.payload = payload
+        self.digest = digest
+        self.updated_at = time.time()
+        self.__valorant: ValorantPresence | None = None
+
+    @property
+    def valorant(self) -> ValorantPresence | None:
+        """The decoded Valorant payload, None if the contact is not in Valorant."""
+
+        if self.__valorant is None and self.payload:
+            try:
+                self.__valorant = decode(
+                    base64.b64decode(self.payload), ValorantPresence
+                )
+            except (binascii.Error, msgspec.DecodeError):
+                # not worth decoding again on every read
+                self.payload = None
+
+        return self.__valorant
+
+    @property
+    def loop_state(self) -> str | None:
+        valorant = self.valorant
+        return None if valorant is None else valorant.loop_state
+
+    def __repr__(self) -> str:
+        return f"Presence(puuid={self.puuid!r}, show={self.show!r})"
+
+
+def parse_jid(jid: str) -> tuple[str, str]:
+    """Splits ``puuid@server/resource`` into the PUUID and the resource."""
+
+    bare, _, resource = jid.partition("/")
+    return bare.partition("@")[0], resource
+
+
+def _preferred(resources: dict[str, Presence]) -> Presence:
+    # the game client's presence, then the most recent one
+    return max(
+        resources.values(),
+        key=lambda presence: (presence.payload is not None, presence.updated_at),
+    )
+
+
+class PresenceStore:
+    """
+    Keeps the latest presence of every client of every contact.
+
+    Stanzas whose show and Valorant payload did not change since the last one
+    from the same client are skipped without being decoded, which is most of
+    them, clients resend their presence on every small state change.
+
+    A contact can be online on several clients at once, e.g. the Riot Client
+    and mobile, the lookups use the client running Valorant if there is one.
+    """
+
+    def __init__(self) -> None:
+        # PUUID -> resource -> presence
+        self.__presences: dict[str, dict[str, Presence]] = {}
+        self.updates = 0
+        self.skipped = 0
+
+    def update(self, element: Element) -> bool:
+        """
+        Stores a presence stanza, returns False only if it was skipped because
+        nothing changed since the last one from the same client.
+        """
+
+        jid = element.get("from")
+        if not jid:
+            # nothing to index it by, e.g. the server echoing our own presence
+            return True
+
+        puuid, resource = parse_jid(jid)
+        resources = self.__presences.get(puuid)
+
+        if element.get("type") == "unavailable":
+            if resources is not None and resources.pop(resource, None) is not None:
+                if not resources:
+                    del self.__presences[puuid]
+                self.updates += 1
+            return True
+
+        show = element.findtext("show", "")
+        payload = element.findtext("games/valorant/p")
+        digest = hash((show, payload))
+
+        current = None if resources is None else resources.get(resource)
+        if current is not None and current.digest == digest:
+            self.skipped += 1
+            return False
+
+        if resources is None:
+            resources = self.__presences[puuid] = {}
+        resources[resource] = Presence(puuid, resource, show, payload, digest)
+        self.updates += 1
+        return True
+
+    def get(self, puuid: str) -> Presence | None:
+        """Returns the presence of the contact's Valorant client, or its latest one."""
+
+        resources = self.__presences.get(puuid)
+        return None if resources is None else _preferred(resources)
+
+    def resources(self, puuid: str) -> list[Presence]:
+        """Returns the presence of every client the contact is online on."""
+
+        return list(self.__presences.get(puuid, {}).values())
+
+    def clear(self) -> None:
+        self.__presences.clear()
+
+    def __contains__(self, puuid: str) -> bool:
+        return puuid in self.__presences
+
+    def __len__(self) -> int:
+        return len(self.__presences)
+
+    def __iter__(self) -> Iterator[Presence]:
+        return iter([_preferred(resources) for resources in self.__presences.values()])
+
+    def filter(self, predicate: Callable[[ValorantPresence], bool]) -> list[Presence]:
+        """Returns the contacts in Valorant whose payload matches ``predicate``."""
+
+        return [
+            presence
+            for presence in self
+            if presence.valorant is not None and predicate(presence.valorant)
+        ]
+
+    def in_state(self, state: SessionLoopState) -> list[Presence]:
+        return self.filter(lambda valorant: valorant.loop_state == state)
+
+    def in_menus(self) -> list[Presence]:
+        return self.in_state("MENUS")
+
+    def in_pregame(self) -> list[Presence]:
+        return self.in_state("PREGAME")
+
+    def in_game(self) -> list[Presence]:
+        return self.in_state("INGAME")
+
+    def in_queue(self, queue_id: str) -> list[Presence]:
+        return self.filter(lambda valorant: valorant.current_queue_id == queue_id)
+
+    def in_party(self, party_id: str) -> list[Presence]:
+        return self.filter(lambda valorant: valorant.current_party_id == party_id)
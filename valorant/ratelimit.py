@@ -0,0 +1,219 @@
+"""
+Rate limiting transport for the Riot hosts
+"""
+
+import asyncio
+import email.utils
+import random
+import time
+
+import httpx
+
+# requests per second and burst size for each kind of host, a login takes
+# about four auth requests and the auth bucket is shared by every account of a
+# pool, so it lets XMPPManager connect an account every 0.1s
+DEFAULT_LIMITS = {
+    "auth": (40.0, 40),
+    "pd": (10.0, 20),
+    "glz": (10.0, 20),
+}
+
+RETRY_STATUSES = (429, 503)
+
+# a 503 may come after the request was processed, so only these are sent again,
+# PUT is idempotent by the spec but the auth PUTs log in
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def get_host_kind(host: str) -> str | None:
+    """Returns the rate limit group of a host, ``None`` if it is not limited."""
+
+    if host.startswith("pd."):
+        return "pd"
+
+    if host.startswith("glz-"):
+        return "glz"
+
+    if host.endswith(".riotgames.com"):
+        return "auth"
+
+    return None
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a ``Retry-After`` header given either in seconds or as a date."""
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, date.timestamp() - time.time())
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.queued = 0
+
+        # waiters are served in FIFO order
+        self.__lock = asyncio.Lock()
+
+    @property
+    def throttled(self) -> bool:
+        return time.monotonic() < self.blocked_until
+
+    def block(self, seconds: float) -> None:
+        """Stops handing out tokens for ``seconds``, e.g. after a 429."""
+
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        self.queued += 1
+        try:
+            async with self.__lock:
+                while True:
+                    now = time.monotonic()
+                    if now < self.blocked_until:
+                        await asyncio.sleep(self.blocked_until - now)
+                        continue
+
+                    self.tokens = min(
+                        self.burst, self.tokens + (now - self.updated) * self.rate
+                    )
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+        finally:
+            self.queued -= 1
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps a transport with one token bucket per auth, pd.<region> and
+    glz-<region> host, retrying 429 responses, and 503 responses to idempotent
+    requests, after their ``Retry-After`` or with jittered exponential
+    backoff. Waits are capped at ``max_backoff``.
+
+    :param limits: requests per second and burst size by kind of host,
+        merged into :data:`DEFAULT_LIMITS`, None for a kind disables its
+        limit
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limits: dict[str, tuple[float, int] | None] | None = None,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ) -> None:
+        self.transport = transport
+        self.limits = {
+            kind: limit
+            for kind, limit in (DEFAULT_LIMITS | (limits or {})).items()
+            if limit is not None
+        }
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.buckets: dict[str, TokenBucket] = {}
+
+    def get_bucket(self, host: str) -> TokenBucket | None:
+        kind = get_host_kind(host)
+        if kind is None or kind not in self.limits:
+            return None
+
+        # all auth hosts share a bucket, pd and glz are limited per region
+        key = kind if kind == "auth" else host
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = TokenBucket(*self.limits[kind])
+
+        return bucket
+
+    def get_backoff(self, attempt: int) -> float:
+        return min(self.max_backoff, self.backoff * 2**attempt) * random.uniform(
+            0.5, 1.5
+        )
+
+    def stats(self) -> dict[str, dict]:
+        """Returns the queue depth and throttle state of every bucket."""
+
+        now = time.monotonic()
+        return {
+            key: {
+                "queued": bucket.queued,
+                "throttled": bucket.throttled,
+                "retry_in": max(0.0, bucket.blocked_until - now),
+                "tokens": bucket.tokens,
+            }
+            for key, bucket in self.buckets.items()
+        }
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        bucket = self.get_bucket(request.url.host)
+        # load the body so it can be sent again on retries
+        await request.aread()
+
+        attempt = 0
+        while True:
+            if bucket is not None:
+                await bucket.acquire()
+
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.ConnectError:
+                # the request never reached the server, so it is safe to resend
+                if attempt == self.max_retries:
+                    raise
+
+                await asyncio.sleep(self.get_backoff(attempt))
+                attempt += 1
+                continue
+
+            if (
+                response.status_code not in RETRY_STATUSES
+                or attempt == self.max_retries
+                or (
+                    response.status_code == 503
+                    and request.method not in IDEMPOTENT_METHODS
+                )
+            ):
+                return response
+
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = self.get_backoff(attempt)
+            else:
+                # a broken or hostile header must not stall the host for good
+                delay = min(delay, self.max_backoff) * random.uniform(1.0, 1.1)
+
+            await response.aclose()
+            if bucket is not None:
+                # hold back every request to this host, not just this one
+                bucket.block(delay)
+            else:
+                await asyncio.sleep(delay)
+
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,77 @@
+"""
+Per-session request context for the pd and glz endpoints
+"""
+
+import base64
+import json
+
+from valorant.constants import Region
+
+CLIENT_PLATFORM = base64.b64encode(
+    json.dumps(
+        {
+            "platformType": "PC",
+            "platformOS": "Windows",
+            "platformOSVersion": "10.0.19042.1.256.64bit",
+            "platformChipset": "Unknown",
+        }
+    ).encode("utf-8")
+).decode("utf-8")
+
+
+class SessionContext:
+    """
+    Base URLs and headers shared by every pd/glz request of a token generation.
+
+    A context is immutable, when any of the tokens or the client version
+    changes a new one has to be built.
+    """
+
+    __slots__ = (
+        "region",
+        "access_token",
+        "entitlement_token",
+        "client_version",
+        "pd_url",
+        "glz_url",
+        "headers",
+    )
+
+    def __init__(
+        self,
+        region: Region,
+        access_token: str,
+        entitlement_token: str,
+        client_version: str,
+    ) -> None:
+        self.region = region
+        self.access_token = access_token
+        self.entitlement_token = entitlement_token
+        self.client_version = client_version
+
+        self.pd_url = f"https://pd.{region.region}.a.pvp.net"
+        self.glz_url = f"https://glz-{region.region}-1.{region.shard}.a.pvp.net"
+        self.headers = {
+            "Authorization": f"Bearer {access_token}",
+            "X-Riot-Entitlements-JWT": entitlement_token,
+            "X-Riot-ClientPlatform": CLIENT_PLATFORM,
+            "X-Riot-ClientVersion": client_version,
+        }
+
+    def matches(
+        self, access_token: str, entitlement_token: str, client_version: str
+    ) -> bool:
+        return (
+            self.access_token == access_token
+            and self.entitlement_token == entitlement_token
+            and self.client_version == client_version
+        )
+
+    def get_url(self, server: str, path: str) -> str:
+        if server == "pd":
+            return self.pd_url + path
+
+        if server == "glz":
+            return self.glz_url + path
+
+        raise ValueError(f"Unknown server {server!r}, expected 'pd' or 'glz'")
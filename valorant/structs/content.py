@@ -0,0 +1,46 @@
+import msgspec
+
+
+class ContentSeason(
+    msgspec.Struct,
+    rename={
+        "id": "ID",
+        "name": "Name",
+        "type": "Type",
+        "start": "StartTime",
+        "end": "EndTime",
+        "is_active": "IsActive",
+    },
+):
+    id: str
+    name: str
+    start: str
+    end: str
+    is_active: bool
+    type: str | None = None
+
+
+class ContentEvent(
+    msgspec.Struct,
+    rename={
+        "id": "ID",
+        "name": "Name",
+        "start": "StartTime",
+        "end": "EndTime",
+        "is_active": "IsActive",
+    },
+):
+    id: str
+    name: str
+    start: str
+    end: str
+    is_active: bool
+
+
+class Content(
+    msgspec.Struct,
+    rename={"disabled_ids": "DisabledIDs", "seasons": "Seasons", "events": "Events"},
+):
+    seasons: list[ContentSeason]
+    events: list[ContentEvent]
+    disabled_ids: list[str] = []
@@ -0,0 +1,84 @@
+import msgspec
+
+
+class ContractProgression(
+    msgspec.Struct,
+    rename={
+        "total_earned": "TotalProgressionEarned",
+        "total_earned_version": "TotalProgressionEarnedVersion",
+        "highest_rewarded_level": "HighestRewardedLevel",
+    },
+):
+    total_earned: int
+    total_earned_version: int = 0
+    highest_rewarded_level: dict | None = None
+
+
+class Contract(
+    msgspec.Struct,
+    rename={
+        "id": "ContractDefinitionID",
+        "progression": "ContractProgression",
+        "level": "ProgressionLevelReached",
+        "progress_to_next_level": "ProgressionTowardsNextLevel",
+    },
+):
+    id: str
+    progression: ContractProgression
+    level: int
+    progress_to_next_level: int
+
+
+class ProcessedMatch(
+    msgspec.Struct,
+    rename={
+        "id": "ID",
+        "start": "StartTime",
+        "xp_grants": "XPGrants",
+        "reward_grants": "RewardGrants",
+        "mission_deltas": "MissionDeltas",
+        "contract_deltas": "ContractDeltas",
+        "could_progress_missions": "CouldProgressMissions",
+    },
+):
+    id: str
+    start: int
+    xp_grants: dict | None = None
+    reward_grants: dict | None = None
+    mission_deltas: dict | None = None
+    contract_deltas: dict | None = None
+    could_progress_missions: bool = False
+
+
+class Mission(
+    msgspec.Struct,
+    rename={
+        "id": "ID",
+        "objectives": "Objectives",
+        "complete": "Complete",
+        "expiration": "ExpirationTime",
+    },
+):
+    id: str
+    objectives: dict[str, int]
+    complete: bool
+    expiration: str
+
+
+class Contracts(
+    msgspec.Struct,
+    rename={
+        "version": "Version",
+        "player_id": "Subject",
+        "contracts": "Contracts",
+        "processed_matches": "ProcessedMatches",
+        "active_special_contract": "ActiveSpecialContract",
+        "missions": "Missions",
+    },
+):
+    version: int
+    player_id: str
+    contracts: list[Contract]
+    processed_matches: list[ProcessedMatch] = []
+    active_special_contract: str = ""
+    missions: list[Mission] = []
@@ -0,0 +1,185 @@
+from typing import Literal
+
+import msgspec
+
+
+class PlayerMatch(
+    msgspec.Struct,
+    rename={"player_id": "Subject", "match_id": "MatchID", "version": "Version"},
+):
+    player_id: str
+    match_id: str
+    version: int
+
+
+class PlayerIdentity(
+    msgspec.Struct,
+    rename={
+        "player_id": "Subject",
+        "player_card_id": "PlayerCardID",
+        "player_title_id": "PlayerTitleID",
+        "level": "AccountLevel",
+        "level_border": "PreferredLevelBorderID",
+        "incognito": "Incognito",
+        "hide_level": "HideAccountLevel",
+    },
+):
+    player_id: str
+    player_card_id: str
+    player_title_id: str
+    level: int
+    level_border: str
+    incognito: bool
+    hide_level: bool
+
+
+class SeasonalBadge(
+    msgspec.Struct,
+    rename={
+        "season_id": "SeasonID",
+        "wins": "NumberOfWins",
+        "wins_by_tier": "WinsByTier",
+        "rank": "Rank",
+        "leaderboard_rank": "LeaderboardRank",
+    },
+):
+    season_id: str
+    wins: int
+    rank: int
+    leaderboard_rank: int
+    wins_by_tier: dict[str, int] | None = None
+
+
+class PregamePlayer(
+    msgspec.Struct,
+    rename={
+        "player_id": "Subject",
+        "character_id": "CharacterID",
+        "selection_state": "CharacterSelectionState",
+        "state": "PregamePlayerState",
+        "rank": "CompetitiveTier",
+        "is_captain": "IsCaptain",
+        "identity": "PlayerIdentity",
+        "badge": "SeasonalBadgeInfo",
+    },
+):
+    player_id: str
+    character_id: str
+    selection_state: Literal["", "selected", "locked"]
+    state: str
+    rank: int
+    identity: PlayerIdentity
+    is_captain: bool = False
+    badge: SeasonalBadge | None = None
+
+
+class PregameTeam(msgspec.Struct, rename={"team": "TeamID", "players": "Players"}):
+    team: str
+    players: list[PregamePlayer]
+
+
+class PregameMatch(
+    msgspec.Struct,
+    rename={
+        "id": "ID",
+        "version": "Version",
+        "teams": "Teams",
+        "ally_team": "AllyTeam",
+        "enemy_team_size": "EnemyTeamSize",
+        "observers": "ObserverSubjects",
+        "state": "PregameState",
+        "map_id": "MapID",
+        "mode": "Mode",
+        "queue_id": "QueueID",
+        "provisioning_flow": "ProvisioningFlowID",
+        "is_ranked": "IsRanked",
+        "phase_time_remaining": "PhaseTimeRemainingNS",
+        "voice_session_id": "VoiceSessionID",
+        "muc_name": "MUCName",
+    },
+):
+    id: str
+    version: int
+    state: str
+    map_id: str
+    mode: str
+    queue_id: str
+    provisioning_flow: str
+    is_ranked: bool
+    phase_time_remaining: int
+    ally_team: PregameTeam | None = None
+    teams: list[PregameTeam] = []
+    enemy_team_size: int = 0
+    observers: list[str] = []
+    voice_session_id: str = ""
+    muc_name: str = ""
+
+
+class PregameLoadouts(
+    msgspec.Struct, rename={"loadouts": "Loadouts", "valid": "LoadoutsValid"}
+):
+    loadouts: list[dict]
+    valid: bool = True
+
+
+class CurrentGamePlayer(
+    msgspec.Struct,
+    rename={
+        "player_id": "Subject",
+        "team": "TeamID",
+        "character_id": "CharacterID",
+        "identity": "PlayerIdentity",
+        "badge": "SeasonalBadgeInfo",
+        "is_coach": "IsCoach",
+        "is_associated": "IsAssociated",
+    },
+):
+    player_id: str
+    team: str
+    character_id: str
+    identity: PlayerIdentity
+    badge: SeasonalBadge | None = None
+    is_coach: bool = False
+    is_associated: bool = False
+
+
+class CurrentGameMatch(
+    msgspec.Struct,
+    rename={
+        "id": "MatchID",
+        "version": "Version",
+        "state": "State",
+        "map_id": "MapID",
+        "mode": "ModeID",
+        "provisioning_flow": "ProvisioningFlow",
+        "game_pod_id": "GamePodID",
+        "all_muc_name": "AllMUCName",
+        "team_muc_name": "TeamMUCName",
+        "team_voice_id": "TeamVoiceID",
+        "is_reconnectable": "IsReconnectable",
+        "players": "Players",
+    },
+):
+    id: str
+    version: int
+    state: str
+    map_id: str
+    mode: str
+    provisioning_flow: str
+    game_pod_id: str
+    players: list[CurrentGamePlayer]
+    all_muc_name: str = ""
+    team_muc_name: str = ""
+    team_voice_id: str = ""
+    is_reconnectable: bool = False
+
+
+class CurrentGameLoadout(
+    msgspec.Struct, rename={"character_id": "CharacterID", "loadout": "Loadout"}
+):
+    character_id: str
+    loadout: dict
+
+
+class CurrentGameLoadouts(msgspec.Struct, rename={"loadouts": "Loadouts"}):
+    loadouts: list[CurrentGameLoadout]
@@ -1,6 +1,9 @@
 from typing import Literal
+
 import msgspec
 
+from valorant.decoding import decode
+
 
 class MatchInfo(
     msgspec.Struct,
@@ -51,6 +54,8 @@ class MatchInfo(
 
 class AbilityCasts(
     msgspec.Struct,
+    frozen=True,
+    gc=False,
     rename={
         "grenade": "grenadeCasts",
         "ability1": "ability1Casts",
@@ -82,20 +87,27 @@ class PlayerMatchStats(
 
 
 class RoundDamage(
-    msgspec.Struct, rename={"receiver_id": "receiver", "amount": "damage"}
+    msgspec.Struct,
+    frozen=True,
+    gc=False,
+    rename={"receiver_id": "receiver", "amount": "damage"},
 ):
     round: int
     receiver_id: str
     amount: int
 
 
-class XPModifier(msgspec.Struct, rename={"id": "ID", "multiplier": "Value"}):
+class XPModifier(
+    msgspec.Struct, frozen=True, gc=False, rename={"id": "ID", "multiplier": "Value"}
+):
     id: str
     multiplier: int
 
 
 class Behavior(
     msgspec.Struct,
+    frozen=True,
+    gc=False,
     rename={
         "afk_rounds": "afkRounds",
         "comms_rating_recovery": "commsRatingRecovery",
@@ -157,13 +169,17 @@ class GamePlayer(
     xp_modifications: list[XPModifier] = None
 
 
-class Coach(msgspec.Struct, rename={"id": "subject", "team": "teamId"}):
+class Coach(
+    msgspec.Struct, frozen=True, gc=False, rename={"id": "subject", "team": "teamId"}
+):
     id: str
     team: Literal["blue", "red"]
 
 
 class Team(
     msgspec.Struct,
+    frozen=True,
+    gc=False,
     rename={
         "team": "teamId",
         "won": "won",
@@ -179,13 +195,17 @@ class Team(
     points: int
 
 
-class Location(msgspec.Struct, rename={"view_radians": "viewRadians"}):
+class Location(
+    msgspec.Struct, frozen=True, gc=False, rename={"view_radians": "viewRadians"}
+):
     x: float
     y: float
 
 
 class PlayerLocation(
     msgspec.Struct,
+    frozen=True,
+    gc=False,
     rename={
         "player_id": "subject",
         "view_radians": "viewRadians",
@@ -199,6 +219,8 @@ class PlayerLocation(
 
 class FinishingDamage(
     msgspec.Struct,
+    frozen=True,
+    gc=False,
     rename={
         "type": "damageType",
         "item": "damageItem",
@@ -213,7 +235,9 @@ class FinishingDamage(
     is_secondary_fire_mode: bool
 
 
-class PlantPlayerLocation(msgspec.Struct, rename={"player_id": "subject"}):
+class PlantPlayerLocation(
+    msgspec.Struct, frozen=True, gc=False, rename={"player_id": "subject"}
+):
     player_id: str
     view_radians: float = msgspec.field(name="viewRadians")
     location: Location
@@ -242,7 +266,7 @@ class Kill(
     finishing_damage: FinishingDamage
 
 
-class Damage(msgspec.Struct):
+class Damage(msgspec.Struct, frozen=True, gc=False):
     receiver_id: str = msgspec.field(name="receiver")
     damage: int
     legshots: int
@@ -252,6 +276,8 @@ class Damage(msgspec.Struct):
 
 class Economy(
     msgspec.Struct,
+    frozen=True,
+    gc=False,
     rename={
         "credits": "loadoutValue",
         "weapon_id": "weapon",
@@ -284,7 +310,7 @@ class PlayerStats(
     stayed_in_spawn: bool
 
 
-class Score(msgspec.Struct):
+class Score(msgspec.Struct, frozen=True, gc=False):
     player_id: str = msgspec.field(name="subject")
     score: int
 
@@ -355,8 +381,45 @@ class MatchDetails(
     rounds: list[Round] | None = None
 
 
+class MatchSummary(
+    msgspec.Struct,
+    rename={"info": "matchInfo", "rounds": "roundResults"},
+):
+    """
+    A :class:`MatchDetails` without the kills and rounds decoded.
+
+    They are kept as raw JSON and only decoded when
+    :meth:`decode_kills` or :meth:`decode_rounds` is called.
+    """
+
+    info: MatchInfo
+    players: list[GamePlayer]
+    coaches: list[Coach]
+    kills: msgspec.Raw = msgspec.Raw(b"[]")
+    teams: list[Team] | None = None
+    rounds: msgspec.Raw = msgspec.Raw(b"null")
+
+    def decode_kills(self) -> list[Kill]:
+        return decode(self.kills, list[Kill])
+
+    def decode_rounds(self) -> list[Round] | None:
+        return decode(self.rounds, list[Round] | None)
+
+    def to_details(self) -> MatchDetails:
+        return MatchDetails(
+            self.info,
+            self.players,
+            self.coaches,
+            self.decode_kills(),
+            self.teams,
+            self.decode_rounds(),
+        )
+
+
 class HistoryMatch(
     msgspec.Struct,
+    frozen=True,
+    gc=False,
     rename={"match_id": "MatchID", "date": "GameStartTime", "queue": "QueueID"},
 ):
     match_id: str
@@ -371,3 +434,11 @@ class HistoryMatchResponse(msgspec.Struct):
     EndIndex: int
     Total: int
     History: list[HistoryMatch]
+
+
+class HistoryMark(msgspec.Struct, frozen=True, gc=False):
+    """The newest match of a player's history seen by the last sync."""
+
+    player_id: str
+    match_id: str
+    date: int
@@ -0,0 +1,97 @@
+import msgspec
+
+
+class SeasonalInfo(
+    msgspec.Struct,
+    rename={
+        "season_id": "SeasonID",
+        "wins": "NumberOfWins",
+        "wins_with_placements": "NumberOfWinsWithPlacements",
+        "games": "NumberOfGames",
+        "rank": "Rank",
+        "capstone_wins": "CapstoneWins",
+        "leaderboard_rank": "LeaderboardRank",
+        "competitive_tier": "CompetitiveTier",
+        "ranked_rating": "RankedRating",
+        "wins_by_tier": "WinsByTier",
+        "games_needed_for_rating": "GamesNeededForRating",
+        "wins_needed_for_rank": "TotalWinsNeededForRank",
+    },
+):
+    season_id: str
+    wins: int = 0
+    wins_with_placements: int = 0
+    games: int = 0
+    rank: int = 0
+    capstone_wins: int = 0
+    leaderboard_rank: int = 0
+    competitive_tier: int = 0
+    ranked_rating: int = 0
+    wins_by_tier: dict[str, int] | None = None
+    games_needed_for_rating: int = 0
+    wins_needed_for_rank: int = 0
+
+
+class QueueSkill(
+    msgspec.Struct,
+    rename={
+        "games_needed_for_rating": "TotalGamesNeededForRating",
+        "games_needed_for_leaderboard": "TotalGamesNeededForLeaderboard",
+        "season_games_needed_for_rating": "CurrentSeasonGamesNeededForRating",
+        "seasons": "SeasonalInfoBySeasonID",
+    },
+):
+    games_needed_for_rating: int = 0
+    games_needed_for_leaderboard: int = 0
+    season_games_needed_for_rating: int = 0
+    seasons: dict[str, SeasonalInfo] | None = None
+
+
+class CompetitiveUpdate(
+    msgspec.Struct,
+    rename={
+        "match_id": "MatchID",
+        "map_id": "MapID",
+        "season_id": "SeasonID",
+        "start": "MatchStartTime",
+        "tier_before": "TierBeforeUpdate",
+        "tier_after": "TierAfterUpdate",
+        "ranked_rating_before": "RankedRatingBeforeUpdate",
+        "ranked_rating_after": "RankedRatingAfterUpdate",
+        "ranked_rating_earned": "RankedRatingEarned",
+        "performance_bonus": "RankedRatingPerformanceBonus",
+        "afk_penalty": "AFKPenalty",
+    },
+):
+    match_id: str
+    map_id: str
+    season_id: str
+    start: int
+    tier_before: int
+    tier_after: int
+    ranked_rating_before: int
+    ranked_rating_after: int
+    ranked_rating_earned: int
+    performance_bonus: int = 0
+    afk_penalty: int = 0
+
+
+class PlayerMMR(
+    msgspec.Struct,
+    rename={
+        "version": "Version",
+        "player_id": "Subject",
+        "finished_new_player_experience": "NewPlayerExperienceFinished",
+        "queues": "QueueSkills",
+        "latest_competitive_update": "LatestCompetitiveUpdate",
+        "is_leaderboard_anonymized": "IsLeaderboardAnonymized",
+        "is_act_rank_badge_hidden": "IsActRankBadgeHidden",
+    },
+):
+    version: int
+    player_id: str
+    queues: dict[str, QueueSkill]
+    finished_new_player_experience: bool = True
+    latest_competitive_update: CompetitiveUpdate | None = None
+    is_leaderboard_anonymized: bool = False
+    is_act_rank_badge_hidden: bool = False
@@ -0,0 +1,84 @@
+from typing import Literal
+
+import msgspec
+
+SessionLoopState = Literal["MENUS", "PREGAME", "INGAME"]
+
+
+class MatchPresence(msgspec.Struct, frozen=True, gc=False, rename="camel"):
+    session_loop_state: str = ""
+    provisioning_flow: str = ""
+    match_map: str = ""
+    queue_id: str = ""
+
+
+class PartyPresence(msgspec.Struct, frozen=True, gc=False, rename="camel"):
+    party_id: str = ""
+    is_party_owner: bool = False
+    party_state: str = ""
+    party_accessibility: str = ""
+    party_size: int = 0
+    max_party_size: int = 0
+
+
+class ValorantPresence(msgspec.Struct, frozen=True, gc=False, rename="camel"):
+    """
+    The private presence of a Valorant client, older clients send every field
+    at the top level while newer ones group them in ``matchPresenceData`` and
+    ``partyPresenceData``, the properties read whichever is present.
+    """
+
+    is_valid: bool = False
+    is_idle: bool = False
+    session_loop_state: str = ""
+    party_owner_session_loop_state: str = ""
+    custom_game_name: str = ""
+    custom_game_team: str = ""
+    party_owner_match_map: str = ""
+    party_owner_match_current_team: str = ""
+    party_owner_match_score_ally_team: int = 0
+    party_owner_match_score_enemy_team: int = 0
+    party_owner_provisioning_flow: str = ""
+    provisioning_flow: str = ""
+    match_map: str = ""
+    party_id: str = ""
+    is_party_owner: bool = False
+    party_state: str = ""
+    party_accessibility: str = ""
+    max_party_size: int = 0
+    party_size: int = 0
+    queue_id: str = ""
+    queue_entry_time: str = ""
+    party_client_version: str = ""
+    player_card_id: str = ""
+    player_title_id: str = ""
+    preferred_level_border_id: str = ""
+    account_level: int = 0
+    competitive_tier: int = 0
+    leaderboard_position: int = 0
+    match_presence_data: MatchPresence | None = None
+    party_presence_data: PartyPresence | None = None
+
+    @property
+    def loop_state(self) -> str:
+        if self.match_presence_data is not None:
+            return self.match_presence_data.session_loop_state
+        return self.session_loop_state
+
+    @property
+    def current_queue_id(self) -> str:
+        if self.match_presence_data is not None:
+            return self.match_presence_data.queue_id
+        return self.queue_id
+
+    @property
+    def current_map(self) -> str:
+        if self.match_presence_data is not None:
+            return self.match_presence_data.match_map
+        return self.match_map
+
+    @property
+    def current_party_id(self) -> str:
+        if self.party_presence_data is not None:
+            return self.party_presence_data.party_id
+        return self.party_id
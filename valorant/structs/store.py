@@ -0,0 +1,166 @@
+import msgspec
+
+
+class Reward(
+    msgspec.Struct,
+    rename={"item_type_id": "ItemTypeID", "item_id": "ItemID", "quantity": "Quantity"},
+):
+    item_type_id: str
+    item_id: str
+    quantity: int
+
+
+class Offer(
+    msgspec.Struct,
+    rename={
+        "id": "OfferID",
+        "is_direct_purchase": "IsDirectPurchase",
+        "start": "StartDate",
+        "cost": "Cost",
+        "rewards": "Rewards",
+    },
+):
+    id: str
+    is_direct_purchase: bool
+    start: str
+    cost: dict[str, int]
+    rewards: list[Reward]
+
+
+class Prices(msgspec.Struct, rename={"offers": "Offers"}):
+    offers: list[Offer]
+
+
+class BundleItemData(
+    msgspec.Struct,
+    rename={"item_type_id": "ItemTypeID", "item_id": "ItemID", "amount": "Amount"},
+):
+    item_type_id: str
+    item_id: str
+    amount: int
+
+
+class BundleItem(
+    msgspec.Struct,
+    rename={
+        "item": "Item",
+        "base_price": "BasePrice",
+        "currency_id": "CurrencyID",
+        "discount_percent": "DiscountPercent",
+        "discounted_price": "DiscountedPrice",
+        "is_promo": "IsPromoItem",
+    },
+):
+    item: BundleItemData
+    base_price: int
+    currency_id: str
+    discount_percent: float
+    discounted_price: int
+    is_promo: bool
+
+
+class Bundle(
+    msgspec.Struct,
+    rename={
+        "id": "ID",
+        "data_asset_id": "DataAssetID",
+        "currency_id": "CurrencyID",
+        "items": "Items",
+        "remaining": "DurationRemainingInSeconds",
+        "wholesale_only": "WholesaleOnly",
+    },
+):
+    id: str
+    data_asset_id: str
+    currency_id: str
+    items: list[BundleItem]
+    remaining: int
+    wholesale_only: bool = False
+
+
+class FeaturedBundle(
+    msgspec.Struct,
+    rename={
+        "bundle": "Bundle",
+        "bundles": "Bundles",
+        "remaining": "BundleRemainingDurationInSeconds",
+    },
+):
+    bundle: Bundle
+    bundles: list[Bundle]
+    remaining: int
+
+
+class SkinsPanel(
+    msgspec.Struct,
+    rename={
+        "offer_ids": "SingleItemOffers",
+        "offers": "SingleItemStoreOffers",
+        "remaining": "SingleItemOffersRemainingDurationInSeconds",
+    },
+):
+    offer_ids: list[str]
+    remaining: int
+    offers: list[Offer] = []
+
+
+class NightMarketOffer(
+    msgspec.Struct,
+    rename={
+        "id": "BonusOfferID",
+        "offer": "Offer",
+        "discount_percent": "DiscountPercent",
+        "discount_costs": "DiscountCosts",
+        "is_seen": "IsSeen",
+    },
+):
+    id: str
+    offer: Offer
+    discount_percent: int
+    discount_costs: dict[str, int]
+    is_seen: bool
+
+
+class NightMarket(
+    msgspec.Struct,
+    rename={
+        "offers": "BonusStoreOffers",
+        "remaining": "BonusStoreRemainingDurationInSeconds",
+    },
+):
+    offers: list[NightMarketOffer]
+    remaining: int
+
+
+class Storefront(
+    msgspec.Struct,
+    rename={
+        "featured": "FeaturedBundle",
+        "skins": "SkinsPanelLayout",
+        "night_market": "BonusStore",
+    },
+):
+    featured: FeaturedBundle
+    skins: SkinsPanel
+    night_market: NightMarket | None = None
+
+
+class Wallet(msgspec.Struct, rename={"balances": "Balances"}):
+    balances: dict[str, int]
+
+
+class Entitlement(
+    msgspec.Struct,
+    rename={"type_id": "TypeID", "item_id": "ItemID", "instance_id": "InstanceID"},
+):
+    type_id: str
+    item_id: str
+    instance_id: str | None = None
+
+
+class OwnedItems(
+    msgspec.Struct,
+    rename={"item_type_id": "ItemTypeID", "entitlements": "Entitlements"},
+):
+    item_type_id: str
+    entitlements: list[Entitlement]
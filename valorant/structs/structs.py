@@ -2,7 +2,6 @@ import msgspec
 
 
 class Version(msgspec.Struct):
-    # TODO: Learn to pass the contents of valorant-api.com "data" attrib to the struct without converting to json
     manifestId: str
     branch: str
     version: str
@@ -11,3 +10,25 @@ class Version(msgspec.Struct):
     riotClientVersion: str
     riotClientBuild: str
     buildDate: str
+
+
+class VersionResponse(msgspec.Struct):
+    status: int
+    data: Version
+
+
+class Penalties(
+    msgspec.Struct,
+    rename={"player_id": "Subject", "penalties": "Penalties", "version": "Version"},
+):
+    player_id: str
+    penalties: list[dict]
+    version: int
+
+
+class Config(
+    msgspec.Struct,
+    rename={"last_application": "LastApplication", "collapsed": "Collapsed"},
+):
+    last_application: str
+    collapsed: dict[str, str]
@@ -0,0 +1,147 @@
+"""
+Incremental match history sync
+"""
+
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Union
+
+import msgspec.json
+
+from valorant.concurrency import Result, fetch_many
+from valorant.decoding import decode
+from valorant.structs.match import HistoryMark, HistoryMatch, MatchDetails
+
+if TYPE_CHECKING:
+    from valorant.pool import SessionPool
+    from valorant.valorant import Valorant
+
+
+class MatchHistorySync:
+    """
+    Keeps track of the newest match seen for every player and returns only
+    the matches played since.
+
+    A sync first asks for a small page, which is enough when a player played
+    a few matches or none since the last one, and only pages further until it
+    reaches the known match.
+
+    :param valorant: a client or a session pool to send the requests through
+    :param first_page_size: size of the first page of every sync
+    :param page_size: size of the following pages
+    :param backfill: the most matches returned by the first sync of a player,
+        None returns the whole available history
+    :param marks: marks of an earlier run, see :meth:`export_marks`
+    """
+
+    def __init__(
+        self,
+        valorant: Union["Valorant", "SessionPool"],
+        first_page_size: int = 5,
+        page_size: int = 20,
+        backfill: int | None = None,
+        marks: Iterable[HistoryMark] = (),
+    ) -> None:
+        self.valorant = valorant
+        self.first_page_size = first_page_size
+        self.page_size = page_size
+        self.backfill = backfill
+        self.marks: dict[str, HistoryMark] = {mark.player_id: mark for mark in marks}
+
+    def _is_known(self, match: HistoryMatch, mark: HistoryMark | None) -> bool:
+        return mark is not None and (
+            match.match_id == mark.match_id or match.date < mark.date
+        )
+
+    async def sync(self, player_id: str) -> list[HistoryMatch]:
+        """
+        Returns the matches of ``player_id`` started since the last sync,
+        newest first, and moves the player's mark to the newest one.
+        """
+
+        new, mark = await self._sync(player_id)
+        if mark is not None:
+            self.marks[player_id] = mark
+
+        return new
+
+    async def _sync(
+        self, player_id: str
+    ) -> tuple[list[HistoryMatch], HistoryMark | None]:
+        """Returns the new matches and the mark to move to, if it changed."""
+
+        mark = self.marks.get(player_id)
+        limit = self.backfill if mark is None else None
+
+        new: list[HistoryMatch] = []
+        seen: set[str] = set()
+        newest = None
+        start, end = 0, self.first_page_size
+        while True:
+            page = await self.valorant.get_match_history_page(player_id, start, end)
+            if start == 0 and page.History:
+                newest = page.History[0]
+
+            for match in page.History:
+                if self._is_known(match, mark) or len(new) == limit:
+                    break
+                # a match finishing mid-sync shifts the later pages by one
+                if match.match_id not in seen:
+                    seen.add(match.match_id)
+                    new.append(match)
+            else:
+                if page.History and page.EndIndex < page.Total:
+                    start, end = page.EndIndex, page.EndIndex + self.page_size
+                    continue
+
+            break
+
+        # also marks a first sync that returned nothing because of backfill=0
+        if newest is None or (mark is not None and not new):
+            return new, None
+
+        return new, HistoryMark(player_id, newest.match_id, newest.date)
+
+    def sync_many(
+        self, player_ids: Iterable[str], concurrency: int = 10
+    ) -> AsyncIterator[Result[str, list[HistoryMatch]]]:
+        """Syncs every player with at most ``concurrency`` requests in flight."""
+
+        return fetch_many(player_ids, self.sync, concurrency)
+
+    async def sync_details(
+        self, player_ids: Iterable[str], concurrency: int = 10
+    ) -> AsyncIterator[Result[str, MatchDetails]]:
+        """
+        Syncs every player and fetches the details of their new matches, a
+        match shared by several players is only fetched once.
+
+        The marks only move once every result was consumed, and only for the
+        players whose sync and match details all succeeded. The others keep
+        their mark, so the next sync returns their matches again.
+        """
+
+        synced: dict[str, tuple[list[HistoryMatch], HistoryMark | None]] = {}
+        async for result in fetch_many(player_ids, self._sync, concurrency):
+            if result.ok:
+                synced[result.key] = result.value
+
+        failed = set()
+        async for result in self.valorant.get_match_details_many(
+            (match.match_id for new, _ in synced.values() for match in new),
+            concurrency,
+        ):
+            if not result.ok:
+                failed.add(result.key)
+            yield result
+
+        for player_id, (new, mark) in synced.items():
+            if mark is not None and not any(match.match_id in failed for match in new):
+                self.marks[player_id] = mark
+
+    def export_marks(self) -> bytes:
+        """Returns the marks as JSON, to resume syncing in another run."""
+
+        return msgspec.json.encode(list(self.marks.values()))
+
+    def import_marks(self, data: bytes) -> None:
+        for mark in decode(data, list[HistoryMark]):
+            self.marks[mark.player_id] = mark
@@ -2,38 +2,108 @@
 Classes and methods related to Valorant API calls
 """
 
-import base64
-import json
+import asyncio
+import contextlib
+from typing import AsyncIterator, Iterable
 
 import httpx
 import msgspec.json
-import requests
 
 from valorant.auth import Auth
+from valorant.cache import MatchCache
+from valorant.concurrency import Result, fetch_many
 from valorant.constants import URLS, API, Region, regions
+from valorant.crawler import LeaderboardCrawler
+from valorant.decoding import decode
+from valorant.ratelimit import RateLimitedTransport
+from valorant.session import CLIENT_PLATFORM, SessionContext
 from valorant.structs.account import AccountXP
+from valorant.structs.agent import AgentResponse
+from valorant.structs.content import Content
+from valorant.structs.contract import Contracts
+from valorant.structs.game import (
+    CurrentGameLoadouts,
+    CurrentGameMatch,
+    PlayerMatch,
+    PregameLoadouts,
+    PregameMatch,
+)
 from valorant.structs.leaderboard import LeaderBoard
 from valorant.structs.loadout import Loadout
 from valorant.structs.match import (
     MatchDetails,
+    MatchInfo,
+    MatchSummary,
     HistoryMatch,
     HistoryMatchResponse,
 )
-from valorant.structs.structs import Version
+from valorant.structs.mmr import PlayerMMR
+from valorant.structs.store import OwnedItems, Prices, Storefront, Wallet
+from valorant.structs.structs import Config, Penalties, Version
 from valorant.structs.user import User
+from valorant.version import VersionProvider
 
 
 class Valorant:
-    def __init__(self, username: str, password: str) -> None:
-        self.client = httpx.AsyncClient()
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        client_version: Version | None = None,
+        version_refresh_interval: float | None = 3600,
+        rate_limits: dict[str, tuple[float, int] | None] | None = None,
+        client: httpx.AsyncClient | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 30.0,
+        http2: bool = False,
+        timeout: float | httpx.Timeout | None = 10.0,
+        match_cache: MatchCache | None = None,
+        versions: VersionProvider | None = None,
+    ) -> None:
+        """
+        :param rate_limits: requests per second and burst size for the
+            ``"auth"``, ``"pd"`` and ``"glz"`` hosts, None disables one, see
+            :class:`~valorant.ratelimit.RateLimitedTransport`
+        :param client: an existing client to send every request through, the
+            pool, HTTP/2, timeout and rate limit options are ignored when given
+            and the client is not closed by :meth:`close`
+        :param http2: multiplex requests over HTTP/2, requires ``httpx[http2]``
+        :param match_cache: where to keep the payloads of finished matches so
+            they are only downloaded once
+        :param versions: a version provider shared with other clients, it
+            replaces ``client_version`` and ``version_refresh_interval`` and is
+            not closed by :meth:`close`
+        """
+
+        if client is None:
+            self.transport = RateLimitedTransport(
+                httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_keepalive_connections,
+                        keepalive_expiry=keepalive_expiry,
+                    ),
+                    http2=http2,
+                ),
+                rate_limits,
+            )
+            client = httpx.AsyncClient(transport=self.transport, timeout=timeout)
+            self.__owns_client = True
+        else:
+            self.transport = None
+            self.__owns_client = False
+
+        self.client = client
+        self.match_cache = match_cache
         self.auth = Auth(self.client, username, password)
+        self.__owns_versions = versions is None
+        self.versions = versions or VersionProvider(
+            self.client, version_refresh_interval, client_version
+        )
 
-        build = requests.get("https://valorant-api.com/v1/version").json()["data"][
-            "riotClientBuild"
-        ]
         self.client.headers.update(
             {
-                "User-Agent": f"RiotClient/{build} riot-status (Windows;10;;Professional, x64)",
                 "Accept-Language": "en-US,en;q=0.9",
                 "Accept": "application/json, text/plain, */*",
             }
@@ -41,51 +111,53 @@ class Valorant:
 
         self.__region = None
         self.__user = None
+        self.__client_build = None
+        self.__session = None
 
     async def start(self) -> None:
+        await self.get_client_version()
         await self.auth.set_auth_cookies()
 
+    async def close(self) -> None:
+        await self.auth.close()
+        if self.__owns_versions:
+            await self.versions.close()
+        if self.__owns_client:
+            await self.client.aclose()
+
     async def get_pd_server(self) -> str:
-        region = await self.get_region()
-        return f"https://pd.{region.region}.a.pvp.net"
+        return (await self.get_session()).pd_url
 
     async def get_glz_server(self) -> str:
-        region = await self.get_region()
-        return f"https://glz-{region.region}-1.{region.shard}.a.pvp.net"
+        return (await self.get_session()).glz_url
 
     @property
-    def client_platform(self) -> bytes:
-        return base64.b64encode(
-            json.dumps(
-                {
-                    "platformType": "PC",
-                    "platformOS": "Windows",
-                    "platformOSVersion": "10.0.19042.1.256.64bit",
-                    "platformChipset": "Unknown",
-                }
-            ).encode("utf-8")
-        )
+    def client_platform(self) -> str:
+        return CLIENT_PLATFORM
 
-    @property
-    def client_version(self) -> Version:
-        version = requests.get(
-            "https://valorant-api.com/v1/version", timeout=30
-        ).json()["data"]
+    async def get_client_version(self) -> Version:
+        version = await self.versions.get_version()
 
-        return Version(**version)
+        if version.riotClientBuild != self.__client_build:
+            self.__client_build = version.riotClientBuild
+            self.client.headers["User-Agent"] = (
+                f"RiotClient/{version.riotClientBuild} riot-status (Windows;10;;Professional, x64)"
+            )
+
+        return version
+
+    async def get_agents(self, playable_only: bool = True) -> AgentResponse:
+        agents = await self.client.get(
+            URLS.AGENTS_URL,
+            params={"isPlayableCharacter": "true"} if playable_only else None,
+        )
+        return decode(agents.content, AgentResponse)
 
     async def get_user(self) -> User:
         if self.__user is not None:
             return self.__user
-        user_info = await self.client.post(
-            URLS.USERINFO_URL,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-            json={},
-        )
-        user = msgspec.json.decode(user_info.content, type=User)
+        user_info = await self._request("POST", "auth", URLS.USERINFO_URL, json={})
+        user = decode(user_info.content, User)
         self.__user = user
         return user
 
@@ -93,105 +165,248 @@ class Valorant:
         if self.__region is not None:
             return self.__region
 
-        region = await self.client.put(
-            "https://riot-geo.pas.si.riotgames.com/pas/v1/product/valorant",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+        region = await self._request(
+            "PUT",
+            "auth",
+            URLS.REGION_URL,
             json={"id_token": await self.auth.get_id_token()},
         )
         region = regions[region.json()["affinities"]["live"]]
         self.__region = region
         return region
 
-    async def get_content(self) -> dict:
-        content = await self.client.get(
-            f"{await self.get_pd_server()}{API.CONTENT}",
-            headers={
-                "X-Riot-ClientPlatform": f"{self.client_platform}",
-                "X-Riot-ClientVersion": f"{self.client_version.riotClientVersion}",
-                "X-Riot-Entitlements-JWT": f"{await self.auth.get_entitlement_token()}",
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+    async def get_session(self) -> SessionContext:
+        """
+        Returns the request context for the current tokens, rebuilding it only
+        when one of the tokens or the client version has changed.
+        """
+
+        access_token = await self.auth.get_access_token()
+        entitlement_token = await self.auth.get_entitlement_token()
+        client_version = (await self.get_client_version()).riotClientVersion
+
+        session = self.__session
+        if session is not None and session.matches(
+            access_token, entitlement_token, client_version
+        ):
+            return session
+
+        self.__session = SessionContext(
+            await self.get_region(), access_token, entitlement_token, client_version
         )
-        return content.json()
+        return self.__session
 
-    async def get_account_xp(self) -> AccountXP:
-        account_xp = await self.client.get(
-            f"{await self.get_pd_server()}{API.ACCOUNT_XP}/{(await self.get_user()).player_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+    async def _request(
+        self,
+        method: str,
+        server: str,
+        path: str,
+        headers: dict | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends a request to the ``"pd"`` or ``"glz"`` server of the account's
+        region, or with ``server="auth"`` to the full URL ``path`` with only
+        the access token, as the account lookups that the region depends on.
+        """
+
+        access_token, response = await self._send(
+            method, server, path, headers, **kwargs
         )
 
-        return msgspec.json.decode(account_xp.content, type=AccountXP)
+        if response.status_code == 401:
+            # the token was revoked or expired early, retry once with a new one
+            await self.auth.refresh(access_token)
+            _, response = await self._send(method, server, path, headers, **kwargs)
+
+        response.raise_for_status()
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        server: str,
+        path: str,
+        headers: dict | None,
+        **kwargs,
+    ) -> tuple[str, httpx.Response]:
+        if server == "auth":
+            access_token = await self.auth.get_access_token()
+            url = path
+            base_headers = {"Authorization": f"Bearer {access_token}"}
+        else:
+            session = await self.get_session()
+            access_token = session.access_token
+            url = session.get_url(server, path)
+            base_headers = session.headers
+
+        response = await self.client.request(
+            method,
+            url,
+            headers=base_headers if headers is None else base_headers | headers,
+            **kwargs,
+        )
+        return access_token, response
+
+    async def get_content(self) -> Content:
+        content = await self._request("GET", "pd", API.CONTENT)
+        return decode(content.content, Content)
+
+    async def get_account_xp(self) -> AccountXP:
+        account_xp = await self._request(
+            "GET", "pd", f"{API.ACCOUNT_XP}/{(await self.get_user()).player_id}"
+        )
+        return decode(account_xp.content, AccountXP)
 
     async def get_loadout(self) -> Loadout:
-        loadout = await self.client.get(
-            f"{await self.get_pd_server()}{API.PERSONALIZATION}/{(await self.get_user()).player_id}/playerloadout",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+        loadout = await self._request(
+            "GET",
+            "pd",
+            f"{API.PERSONALIZATION}/{(await self.get_user()).player_id}/playerloadout",
         )
-        return msgspec.json.decode(loadout.content, type=Loadout)
+        return decode(loadout.content, Loadout)
 
     async def set_loadout(self, loadout: Loadout) -> None:
-        await self.client.put(
-            f"{await self.get_pd_server()}{API.PERSONALIZATION}/{(await self.get_user()).player_id}/playerloadout",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-            json=msgspec.json.encode(loadout),
+        await self._request(
+            "PUT",
+            "pd",
+            f"{API.PERSONALIZATION}/{(await self.get_user()).player_id}/playerloadout",
+            headers={"Content-Type": "application/json"},
+            content=msgspec.json.encode(loadout),
         )
 
-    async def get_player_mmr(self, player_id: str | None = None) -> dict:
+    async def get_player_mmr(self, player_id: str | None = None) -> PlayerMMR:
+        if player_id is None:
+            player_id = (await self.get_user()).player_id
+
+        player_mmr = await self._request("GET", "pd", f"{API.MMR}/{player_id}")
+        return decode(player_mmr.content, PlayerMMR)
+
+    async def get_match_history_page(
+        self,
+        player_id: str | None = None,
+        start: int = 0,
+        end: int = 20,
+    ) -> HistoryMatchResponse:
+        # TODO: add queue parameter when ids are known
         if player_id is None:
             player_id = (await self.get_user()).player_id
 
-        player_mmr = await self.client.get(
-            f"{await self.get_pd_server()}{API.MMR}/{player_id}",
-            headers={
-                "X-Riot-ClientPlatform": self.client_platform,
-                "X-Riot-ClientVersion": self.client_version.riotClientVersion,
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+        history = await self._request(
+            "GET",
+            "pd",
+            f"{API.HISTORY}/{player_id}?startIndex={start}&endIndex={end}",
         )
-        return player_mmr.json()
+        return decode(history.content, HistoryMatchResponse)
 
     async def get_match_history(
         self,
         player_id: str | None = None,
-        offset: int | None = 0,
-        amount: int | None = 20,
+        offset: int = 0,
+        amount: int = 20,
     ) -> list[HistoryMatch]:
-        # TODO: add queue parameter when ids are known
+        page = await self.get_match_history_page(player_id, offset, offset + amount)
+        return page.History
+
+    async def iter_match_history(
+        self,
+        player_id: str | None = None,
+        page_size: int = 20,
+        since: int | None = None,
+        until_match_id: str | None = None,
+    ) -> AsyncIterator[HistoryMatch]:
+        """
+        Yields the whole match history of a player, newest first, while the
+        next page is already being fetched.
+
+        :param since: stop at the first match that started before this unix
+            timestamp in milliseconds
+        :param until_match_id: stop when reaching this match, without yielding it
+        """
+
         if player_id is None:
             player_id = (await self.get_user()).player_id
 
-        history = await self.client.get(
-            f"{await self.get_pd_server()}{API.HISTORY}/{player_id}?startIndex={offset}&endIndex={amount}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+        next_page = asyncio.create_task(
+            self.get_match_history_page(player_id, 0, page_size)
         )
-        # TODO make this return a list of MatchHistory
-        return msgspec.json.decode(history.content, type=HistoryMatchResponse).History
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if page.History and page.EndIndex < page.Total:
+                    next_page = asyncio.create_task(
+                        self.get_match_history_page(
+                            player_id, page.EndIndex, page.EndIndex + page_size
+                        )
+                    )
+
+                for match in page.History:
+                    if match.match_id == until_match_id or (
+                        since is not None and match.date < since
+                    ):
+                        return
+
+                    yield match
+        finally:
+            if next_page is not None:
+                # the consumer stopped early, the prefetch is not needed
+                next_page.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await next_page
+
+    async def _get_match_content(self, match_id: str) -> tuple[bytes, bool]:
+        """Returns the raw match payload and whether it came from the cache."""
+
+        if self.match_cache is not None:
+            content = await self.match_cache.aget(match_id)
+            if content is not None:
+                return content, True
+
+        match = await self._request("GET", "pd", f"{API.MATCHES}/{match_id}")
+        return match.content, False
+
+    async def _cache_match(
+        self, match_id: str, content: bytes, info: MatchInfo
+    ) -> None:
+        if self.match_cache is not None and info.has_finished:
+            await self.match_cache.aput(match_id, content)
 
     async def get_match_details(self, match_id: str) -> MatchDetails:
-        match = await self.client.get(
-            f"{await self.get_pd_server()}{API.MATCHES}/{match_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return msgspec.json.decode(match.content, type=MatchDetails)
+        content, cached = await self._get_match_content(match_id)
+        details = decode(content, MatchDetails)
+        if not cached:
+            await self._cache_match(match_id, content, details.info)
+
+        return details
+
+    async def get_match_summary(self, match_id: str) -> MatchSummary:
+        """
+        Like :meth:`get_match_details` but only decodes the match info, players
+        and teams, the kills and rounds are kept as raw JSON, see
+        :class:`MatchSummary`.
+        """
+
+        content, cached = await self._get_match_content(match_id)
+        summary = decode(content, MatchSummary)
+        if not cached:
+            await self._cache_match(match_id, content, summary.info)
+
+        return summary
+
+    def get_match_details_many(
+        self, match_ids: Iterable[str], concurrency: int = 10, ordered: bool = False
+    ) -> AsyncIterator[Result[str, MatchDetails]]:
+        """
+        Fetches the details of every unique match ID with at most
+        ``concurrency`` requests in flight.
+
+        Yields a :class:`Result` per match as it completes, or in the order of
+        ``match_ids`` if ``ordered`` is set. Failed matches carry their error
+        instead of aborting the batch.
+        """
+
+        return fetch_many(match_ids, self.get_match_details, concurrency, ordered)
 
     async def get_leaderboard(
         self,
@@ -200,233 +415,157 @@ class Valorant:
         amount: int = 510,
         username: str | None = None,
     ) -> LeaderBoard:
-        leaderboard = await self.client.get(
-            (
-                f"{await self.get_pd_server()}{API.LEADERBOARD}/{season_id}?startIndex={start}&size={amount}"
-                + f"&query={username}"
-                if username
-                else ""
-            ),
-            headers={
-                "X-Riot-ClientVersion": self.client_version.riotClientVersion,
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return msgspec.json.decode(leaderboard.content, type=LeaderBoard)
-
-    async def get_penalties(self) -> dict:
-        penalties = await self.client.get(
-            f"{await self.get_pd_server()}{API.PENALTIES}",
-            headers={
-                "X-Riot-ClientPlatform": self.client_platform,
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return penalties.json()
+        path = f"{API.LEADERBOARD}/{season_id}?startIndex={start}&size={amount}"
+        if username:
+            path += f"&query={username}"
+
+        leaderboard = await self._request("GET", "pd", path)
+        return decode(leaderboard.content, LeaderBoard)
+
+    def crawl_leaderboard(
+        self,
+        season_id: str,
+        page_size: int = 510,
+        concurrency: int = 5,
+        start: int = 0,
+    ) -> LeaderboardCrawler:
+        """
+        Returns a resumable crawler that yields every leaderboard page of a
+        season in order, see :class:`LeaderboardCrawler`.
+        """
+
+        return LeaderboardCrawler(self, season_id, page_size, concurrency, start)
+
+    async def get_penalties(self) -> Penalties:
+        penalties = await self._request("GET", "pd", API.PENALTIES)
+        return decode(penalties.content, Penalties)
 
-    async def get_config(self) -> dict:
+    async def get_config(self) -> Config:
         region = await self.get_region()
-        config = await self.client.get(
-            f"{await self.get_pd_server()}{API.CONFIG}/{region.region}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return config.json()
-
-    async def get_prices(self) -> dict:
-        prices = await self.client.get(
-            f"{await self.get_pd_server()}{API.PRICES}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
+        config = await self._request("GET", "pd", f"{API.CONFIG}/{region.region}")
+        return decode(config.content, Config)
 
-        return prices.json()
-
-    async def get_store(self) -> dict:
-        store = await self.client.get(
-            f"{await self.get_pd_server()}{API.STORE}/{(await self.get_user()).player_id}",
-            headers={
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "X-Riot-ClientPlatform": self.client_platform,
-                "X-Riot-ClientVersion": self.client_version.riotClientVersion,
-                "Content-Type": "application/json",
-            },
-        )
+    async def get_prices(self) -> Prices:
+        prices = await self._request("GET", "pd", API.PRICES)
+        return decode(prices.content, Prices)
 
-        return store.json()
+    async def get_store(self) -> Storefront:
+        store = await self._request(
+            "GET", "pd", f"{API.STORE}/{(await self.get_user()).player_id}"
+        )
+        return decode(store.content, Storefront)
 
-    async def get_wallet(self) -> dict:
-        wallet = await self.client.get(
-            f"{await self.get_pd_server()}{API.WALLET}/{(await self.get_user()).player_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+    async def get_wallet(self) -> Wallet:
+        wallet = await self._request(
+            "GET", "pd", f"{API.WALLET}/{(await self.get_user()).player_id}"
         )
-        return wallet.json()
-
-    async def get_items(self, item_type: str) -> dict:
-        items = await self.client.get(
-            f"{await self.get_pd_server()}{API.OWNED}/{(await self.get_user()).player_id}/{item_type}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+        return decode(wallet.content, Wallet)
+
+    async def get_items(self, item_type: str) -> OwnedItems:
+        items = await self._request(
+            "GET", "pd", f"{API.OWNED}/{(await self.get_user()).player_id}/{item_type}"
         )
-        return items.json()
+        return decode(items.content, OwnedItems)
 
-    async def get_pregame_id(self, player_id: str | None = None) -> dict:
+    async def get_pregame_id(self, player_id: str | None = None) -> PlayerMatch:
         if player_id is None:
             player_id = (await self.get_user()).player_id
 
-        pregame = await self.client.get(
-            f"{await self.get_glz_server()}{API.PREGAME_PLAYER}/{player_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-
-        return pregame.json()
+        pregame = await self._request("GET", "glz", f"{API.PREGAME_PLAYER}/{player_id}")
+        return decode(pregame.content, PlayerMatch)
 
-    async def get_pregame_match(self, pregame_match_id: str | None = None) -> dict:
+    async def get_pregame_match(
+        self, pregame_match_id: str | None = None
+    ) -> PregameMatch:
         if pregame_match_id is None:
-            pregame_match_id = (await self.get_pregame_id())["MatchID"]
-
-        pregame_match = await self.client.get(
-            f"{await self.get_glz_server()}{API.PREGAME_MATCH}/{pregame_match_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            pregame_match_id = (await self.get_pregame_id()).match_id
+
+        pregame_match = await self._request(
+            "GET", "glz", f"{API.PREGAME_MATCH}/{pregame_match_id}"
         )
-        return pregame_match.json()
+        return decode(pregame_match.content, PregameMatch)
 
-    async def get_pregame_loadout(self, pregame_match_id: str | None = None) -> dict:
+    async def get_pregame_loadout(
+        self, pregame_match_id: str | None = None
+    ) -> PregameLoadouts:
         if pregame_match_id is None:
-            pregame_match_id = (await self.get_pregame_id())["MatchID"]
-
-        pregame_loadout = await self.client.get(
-            f"{await self.get_glz_server()}{API.PREGAME_MATCH}/{pregame_match_id}/loadouts",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            pregame_match_id = (await self.get_pregame_id()).match_id
+
+        pregame_loadout = await self._request(
+            "GET", "glz", f"{API.PREGAME_MATCH}/{pregame_match_id}/loadouts"
         )
-        return pregame_loadout.json()
+        return decode(pregame_loadout.content, PregameLoadouts)
 
     async def select_agent(
         self, agent_id: str, pregame_match_id: str | None = None
-    ) -> dict:
+    ) -> PregameMatch:
         if pregame_match_id is None:
-            pregame_match_id = self.get_pregame_id()
-
-        agent_select = await self.client.post(
-            f"{await self.get_glz_server()}{API.MATCHES}/{pregame_match_id}/select/{agent_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            pregame_match_id = (await self.get_pregame_id()).match_id
+
+        agent_select = await self._request(
+            "POST", "glz", f"{API.PREGAME_MATCH}/{pregame_match_id}/select/{agent_id}"
         )
-        return agent_select.json()
+        return decode(agent_select.content, PregameMatch)
 
     async def lock_agent(
         self, agent_id: str, pregame_match_id: str | None = None
-    ) -> dict:
+    ) -> PregameMatch:
         if pregame_match_id is None:
-            pregame_match_id = self.get_pregame_id()
-
-        agent_lock = await self.client.post(
-            f"{await self.get_glz_server()}{API.MATCHES}/{pregame_match_id}/lock/{agent_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            pregame_match_id = (await self.get_pregame_id()).match_id
+
+        agent_lock = await self._request(
+            "POST", "glz", f"{API.PREGAME_MATCH}/{pregame_match_id}/lock/{agent_id}"
         )
-        return agent_lock.json()
+        return decode(agent_lock.content, PregameMatch)
 
-    async def quit_pregame(self, pregame_match_id: str | None = None) -> dict:
+    async def quit_pregame(self, pregame_match_id: str | None = None) -> None:
         if pregame_match_id is None:
-            pregame_match_id = self.get_pregame_id()
-
-        pregame_quit = await self.client.post(
-            f"{await self.get_glz_server()}{API.MATCHES}/{pregame_match_id}/quit",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            pregame_match_id = (await self.get_pregame_id()).match_id
+
+        await self._request(
+            "POST", "glz", f"{API.PREGAME_MATCH}/{pregame_match_id}/quit"
         )
-        return pregame_quit.json()
 
-    async def get_current_game_player(self, player_id: str | None = None) -> dict:
+    async def get_current_game_player(
+        self, player_id: str | None = None
+    ) -> PlayerMatch:
         if player_id is None:
             player_id = (await self.get_user()).player_id
 
-        current_game_player = await self.client.get(
-            f"{await self.get_glz_server()}{API.CURRENT_GAME_PLAYER}/{player_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+        current_game_player = await self._request(
+            "GET", "glz", f"{API.CURRENT_GAME_PLAYER}/{player_id}"
         )
-        return current_game_player.links
+        return decode(current_game_player.content, PlayerMatch)
 
-    async def get_current_game_match(self, current_match_id: str | None = None) -> dict:
+    async def get_current_game_match(
+        self, current_match_id: str | None = None
+    ) -> CurrentGameMatch:
         if current_match_id is None:
-            current_match_id = (await self.get_pregame_id())["MatchID"]
-
-        current_game_match = await self.client.get(
-            f"{await self.get_glz_server()}{API.CURRENT_GAME_MATCH}/{current_match_id}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+            current_match_id = (await self.get_current_game_player()).match_id
+
+        current_game_match = await self._request(
+            "GET", "glz", f"{API.CURRENT_GAME_MATCH}/{current_match_id}"
         )
-        return current_game_match.json()
+        return decode(current_game_match.content, CurrentGameMatch)
 
     async def get_current_game_loadout(
         self, current_match_id: str | None = None
-    ) -> dict:
+    ) -> CurrentGameLoadouts:
         if current_match_id is None:
-            current_match_id = (await self.get_pregame_id())["MatchID"]
-
-        current_game_loadout = await self.client.get(
-            f"{await self.get_glz_server()}{API.CURRENT_GAME_MATCH}/{current_match_id}/loadouts",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return current_game_loadout.json()
+            current_match_id = (await self.get_current_game_player()).match_id
 
-    async def get_item_upgrades(self) -> dict:
-        item_upgrades = await self.client.get(
-            f"{await self.get_pd_server()}{API.ITEM_UPGRADES}",
-            headers={
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
+        current_game_loadout = await self._request(
+            "GET", "glz", f"{API.CURRENT_GAME_MATCH}/{current_match_id}/loadouts"
         )
+        return decode(current_game_loadout.content, CurrentGameLoadouts)
 
+    async def get_item_upgrades(self) -> dict:
+        item_upgrades = await self._request("GET", "pd", API.ITEM_UPGRADES)
         return item_upgrades.json()
 
-    async def get_contracts(self, player_id: str | None = None) -> dict:
+    async def get_contracts(self, player_id: str | None = None) -> Contracts:
         if player_id is None:
             player_id = (await self.get_user()).player_id
 
-        contracts = await self.client.get(
-            f"{await self.get_pd_server()}{API.CONTRACTS}/{player_id}",
-            headers={
-                "X-Riot-ClientVersion": self.client_version.riotClientVersion,
-                "X-Riot-Entitlements-JWT": await self.auth.get_entitlement_token(),
-                "Authorization": f"Bearer {await self.auth.get_access_token()}",
-            },
-        )
-        return contracts.json()
+        contracts = await self._request("GET", "pd", f"{API.CONTRACTS}/{player_id}")
+        return decode(contracts.content, Contracts)
@@ -0,0 +1,118 @@
+"""
+Client version resolution backed by valorant-api.com
+"""
+
+import asyncio
+import logging
+import time
+
+import httpx
+
+from valorant.constants import URLS
+from valorant.decoding import decode
+from valorant.structs.structs import Version, VersionResponse
+
+logger = logging.getLogger(__name__)
+
+
+class VersionProvider:
+    """
+    Resolves the current Riot client version once and caches it.
+
+    The version is refreshed at most every ``refresh_interval`` seconds
+    (never if it is ``None``), and a pinned version is never refreshed.
+
+    Once a version is known, refreshes run in the background and callers get
+    the cached version meanwhile. A failed refresh keeps the cached version
+    and is retried after ``retry_interval`` seconds. Only the first
+    resolution is awaited, by every caller at once, and its error raised.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        refresh_interval: float | None = 3600,
+        version: Version | None = None,
+        retry_interval: float = 60,
+    ) -> None:
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+
+        self.__version = version
+        self.__pinned = version is not None
+        self.__next_refresh = time.monotonic() + (refresh_interval or 0)
+        self.__task: asyncio.Task | None = None
+
+    @property
+    def pinned(self) -> bool:
+        return self.__pinned
+
+    def pin(self, version: Version) -> None:
+        """Uses ``version`` for every request until :meth:`unpin` is called."""
+
+        self.__version = version
+        self.__pinned = True
+
+    def unpin(self) -> None:
+        """Resolves the version from valorant-api.com again on next use."""
+
+        self.__pinned = False
+        self.__version = None
+
+    def is_stale(self) -> bool:
+        if self.__version is None:
+            return True
+
+        if self.__pinned or self.refresh_interval is None:
+            return False
+
+        return time.monotonic() >= self.__next_refresh
+
+    async def _fetch(self) -> Version:
+        response = await self.client.get(URLS.VERSION_URL, timeout=30)
+        response.raise_for_status()
+        return decode(response.content, VersionResponse).data
+
+    async def _refresh(self) -> Version:
+        try:
+            version = await self._fetch()
+        except Exception:
+            if self.__version is None:
+                raise
+
+            # nobody awaits a background refresh, keep serving the cached
+            # version and try again later
+            logger.warning("Refreshing the client version failed", exc_info=True)
+            self.__next_refresh = time.monotonic() + self.retry_interval
+            return self.__version
+
+        if not self.__pinned:
+            self.__version = version
+        self.__next_refresh = time.monotonic() + (self.refresh_interval or 0)
+        return self.__version
+
+    async def get_version(self) -> Version:
+        if not self.is_stale():
+            return self.__version
+
+        # every caller shares the attempt in flight
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self._refresh())
+
+        if self.__version is not None:
+            return self.__version
+
+        # a cancelled caller must not cancel the attempt the others wait on
+        return await asyncio.shield(self.__task)
+
+    async def close(self) -> None:
+        """Stops a refresh in flight."""
+
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self.__task = None
@@ -1,11 +1,51 @@
 import abc
 import asyncio
+import itertools
+import logging
+import random
+import socket
 import ssl
+import time
+import uuid
+from typing import Iterable
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
+import httpx
+
 from valorant import Valorant
 from valorant.constants import xmpp_regions, xmpp_servers
+from valorant.presence import PresenceStore
+from valorant.xmpp_dispatch import Overflow, StanzaDispatcher
+from valorant.xmpp_parser import StanzaParser
+from valorant.xmpp_writer import StanzaWriter
+
+logger = logging.getLogger(__name__)
+
+# everything that means the connection or the token lookup has to be retried
+CONNECTION_ERRORS = (
+    OSError,
+    EOFError,
+    asyncio.TimeoutError,
+    asyncio.LimitOverrunError,
+    httpx.HTTPError,
+)
+
+
+class IQError(Exception):
+    """An IQ request was answered with an error."""
+
+    def __init__(self, element: Element) -> None:
+        self.element = element
+
+        error = element.find("error")
+        self.type = None if error is None else error.get("type")
+        # the condition is the first child of <error>, e.g. item-not-found
+        self.condition = None
+        if error is not None and len(error):
+            self.condition = error[0].tag.rpartition("}")[2]
+
+        super().__init__(f"IQ {element.get('id')} failed: {self.condition} ({self.type})")
 
 
 class XMPP(abc.ABC):
@@ -18,28 +58,121 @@ class XMPP(abc.ABC):
     def __init__(
             self,
             username: str,
-            password: str
+            password: str,
+            workers: int | dict[str, int] = 1,
+            queue_size: int | dict[str, int] = 1000,
+            overflow: Overflow | dict[str, Overflow] | None = None,
+            keepalive_interval: float | None = 60,
+            keepalive_timeout: float = 20,
+            read_timeout: float | None = 150,
+            reconnect_delay: float = 1,
+            max_reconnect_delay: float = 60,
+            write_linger: float = 0.002,
+            write_high_water: int = 64 * 1024,
+            write_low_water: int = 16 * 1024,
+            valorant: Valorant | None = None,
+            context: ssl.SSLContext | None = None,
+            dispatcher: StanzaDispatcher | None = None,
+            connect_limiter: asyncio.Semaphore | None = None
     ) -> None:
-        """Initializes the RiotXMPP object."""
-        self.val = Valorant(username, password)
+        """
+        Initializes the RiotXMPP object.
+
+        :param workers: worker tasks per stanza type
+        :param queue_size: queued stanzas per stanza type
+        :param overflow: what to do when a queue is full, by default presences
+            are coalesced by JID and other stanzas block the reader
+        :param keepalive_interval: seconds between pings (XEP-0199), None
+            disables them
+        :param keepalive_timeout: seconds to wait for a ping's answer before
+            the connection is considered dead, also used as the TCP user
+            timeout where the OS supports it
+        :param read_timeout: seconds without any data after which the
+            connection is considered dead, None waits forever, keep it above
+            ``keepalive_interval`` so the pings keep the stream busy
+        :param reconnect_delay: seconds :meth:`run` waits before the first
+            reconnect, doubled on every failed attempt
+        :param max_reconnect_delay: upper bound of the reconnect delay
+        :param write_linger: seconds outgoing stanzas are held back to be
+            written together with the ones that follow
+        :param write_high_water: buffered outgoing bytes above which
+            :meth:`send` waits until they drop below ``write_low_water``
+        :param valorant: an existing client to take the tokens from, e.g. a
+            :class:`~valorant.pool.SessionPool` session, ``username`` and
+            ``password`` are ignored when given
+        :param context: an SSL context shared with other connections
+        :param dispatcher: a dispatcher shared with other connections, it is
+            started and stopped by its owner and gets ``(connection, stanza)``
+            items, the queue options are ignored when given
+        :param connect_limiter: limits how many connections sharing it connect
+            and authenticate at the same time
+        """
+        self.val = valorant or Valorant(username, password)
         self.processors = {
             "presence": self.process_presence,
             "iq": self.process_iq,
             "message": self.process_message
         }
 
+        self.__owns_dispatcher = dispatcher is None
+        if dispatcher is None:
+            dispatcher = StanzaDispatcher(
+                self.processors,
+                workers,
+                queue_size,
+                {"presence": "coalesce"} if overflow is None else overflow
+            )
+        self.dispatcher = dispatcher
+        self.connect_limiter = connect_limiter
+
         self.reader: asyncio.StreamReader | None = None
         self.writer: asyncio.StreamWriter | None = None
-
-        self.region = self.val.get_region()
-        self.xmpp_region = xmpp_regions[self.region.region]
-        self.xmpp_server = xmpp_servers[self.xmpp_region]
-
-        self.context = ssl.create_default_context()
-        self.context.check_hostname = True
-        self.context.verify_mode = ssl.CERT_REQUIRED
-
-        self.buffer = b""
+        self.stanza_writer: StanzaWriter | None = None
+        self.write_linger = write_linger
+        self.write_high_water = write_high_water
+        self.write_low_water = write_low_water
+
+        # resolved on the first connect, the region lookup needs a login
+        self.region = None
+        self.xmpp_region: str | None = None
+        self.xmpp_server: str | None = None
+
+        self.keepalive_interval = keepalive_interval
+        self.keepalive_timeout = keepalive_timeout
+        self.read_timeout = read_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        # sent again after every reconnect
+        self.presence = b"<presence/>"
+        self.reconnects = 0
+        self.received = 0
+        self.sent = 0
+        self.connected_at: float | None = None
+        self.last_received = 0.0
+        self.last_error: str | None = None
+        self.__closing = False
+        # why the connection was dropped on our side, reported by the reader
+        self.__drop_reason: str | None = None
+        # set while the reader waits for room in a full "block" queue, it reads
+        # nothing meanwhile, so the pings can not be answered
+        self.__reader_blocked = False
+        self.__keepalive_task: asyncio.Task | None = None
+        self.__reader_task: asyncio.Task | None = None
+
+        # IQ id -> future resolved with the response
+        self.__pending_iqs: dict[str, asyncio.Future] = {}
+        self.__iq_prefix = uuid.uuid4().hex[:8]
+        self.__iq_ids = itertools.count()
+
+        if context is None:
+            context = ssl.create_default_context()
+            context.check_hostname = True
+            context.verify_mode = ssl.CERT_REQUIRED
+        self.context = context
+
+        self.parser = StanzaParser()
+        self.presences = PresenceStore()
 
     def get_stream_element(self) -> bytes:
         """Returns the stream element in byte format."""
@@ -47,8 +180,13 @@ class XMPP(abc.ABC):
         stream = rf'<?xml version="1.0" encoding="UTF-8"?><stream:stream to="{self.xmpp_region}.pvp.net" xml:lang="en" version="1.0" xmlns="jabber:client" xmlns:stream="http://etherx.jabber.org/streams">'
         return stream.encode(encoding="UTF-8")
 
-    def get_rso_auth(self) -> bytes:
-        """Returns the RSO authentication element in byte format."""
+    async def get_rso_auth(self) -> bytes:
+        """
+        Returns the RSO authentication element in byte format.
+
+        The tokens come from the auth cache, so reconnecting does not log in
+        again while they are fresh.
+        """
 
         auth = Element(
             "auth",
@@ -58,20 +196,20 @@ class XMPP(abc.ABC):
             },
         )
         rso_token_elem = Element("rso_token")
-        rso_token_elem.text = self.val.auth.get_access_token()
+        rso_token_elem.text = await self.val.auth.get_access_token()
         auth.append(rso_token_elem)
 
         pas_token_elem = Element("pas_token")
-        pas_token_elem.text = self.val.auth.get_pas_token()
+        pas_token_elem.text = await self.val.auth.get_pas_token()
         auth.append(pas_token_elem)
 
         return ElementTree.tostring(auth, encoding="utf-8")
 
     @staticmethod
-    def get_bind_request() -> bytes:
-        """Returns the bind request element in byte format."""
+    def get_bind_request() -> Element:
+        """Returns the bind request element."""
 
-        iq_element = Element("iq", attrib={"id": "_xmpp_bind1", "type": "set"})
+        iq_element = Element("iq", attrib={"type": "set"})
         bind_element = Element(
             "bind", attrib={"xmlns": "urn:ietf:params:xml:ns:xmpp-bind"}
         )
@@ -82,26 +220,26 @@ class XMPP(abc.ABC):
 
         bind_element.append(puuid_element)
 
-        return ElementTree.tostring(iq_element, encoding="utf-8")
+        return iq_element
 
-    def get_entitlement_request(self) -> bytes:
-        """Returns the entitlements request element in byte format."""
+    async def get_entitlement_request(self) -> Element:
+        """Returns the entitlements request element."""
 
-        iq_element = Element("iq", attrib={"id": "xmpp_entitlements_0", "type": "set"})
+        iq_element = Element("iq", attrib={"type": "set"})
         entitlements_element = Element(
             "entitlements", attrib={"xmlns": "urn:riotgames:entitlements"}
         )
         token_element = Element("token")
-        token_element.text = self.val.auth.get_entitlement_token()
+        token_element.text = await self.val.auth.get_entitlement_token()
         iq_element.append(entitlements_element)
         entitlements_element.append(token_element)
-        return ElementTree.tostring(iq_element, encoding="utf-8")
+        return iq_element
 
     @staticmethod
-    def get_session_request() -> bytes:
-        """Returns the session request element in byte format."""
+    def get_session_request() -> Element:
+        """Returns the session request element."""
 
-        iq_element = Element("iq", attrib={"id": "_xmpp_session1", "type": "set"})
+        iq_element = Element("iq", attrib={"type": "set"})
         session_element = Element(
             "session", attrib={"xmlns": "urn:ietf:params:xml:ns:xmpp-session"}
         )
@@ -109,31 +247,238 @@ class XMPP(abc.ABC):
         platform_element.text = "riot"
         iq_element.append(session_element)
         session_element.append(platform_element)
-        return ElementTree.tostring(iq_element, encoding="utf-8")
+        return iq_element
 
     async def connect(self):
         """Establishes the connection to the server."""
 
-        self.reader, self.writer = await asyncio.open_connection(
-            host=self.xmpp_server, port=5223, ssl=self.context
+        if self.xmpp_server is None:
+            await self.val.start()
+            self.region = await self.val.get_region()
+            self.xmpp_region = xmpp_regions[self.region.region]
+            self.xmpp_server = xmpp_servers[self.xmpp_region]
+
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(host=self.xmpp_server, port=5223, ssl=self.context),
+            self.read_timeout
+        )
+
+        sock = self.writer.get_extra_info("socket")
+        if sock is not None:
+            self.set_socket_options(sock)
+
+        self.stanza_writer = StanzaWriter(
+            self.writer, self.write_linger, self.write_high_water, self.write_low_water
         )
+        self.stanza_writer.start()
+
+        self.connected_at = self.last_received = time.monotonic()
         print("Connected")
 
     async def send(self, message: bytes):
-        self.writer.write(message)
-        await self.writer.drain()
+        """
+        Queues a stanza, it is written together with any other stanza sent
+        within ``write_linger`` seconds.
+
+        :raises ConnectionError: if there is no connection
+        """
+
+        if self.writer is None:
+            raise ConnectionError("The XMPP client is not connected")
+        await self.stanza_writer.send(message)
+
+    async def send_many(self, messages: Iterable[bytes]):
+        """Queues several stanzas to be written at once."""
+
+        if self.writer is None:
+            raise ConnectionError("The XMPP client is not connected")
+        await self.stanza_writer.send_many(messages)
+
+    async def flush(self):
+        """Waits until every queued stanza has been written."""
+
+        if self.writer is None:
+            raise ConnectionError("The XMPP client is not connected")
+        await self.stanza_writer.flush()
+
+    async def send_presence(self, presence: bytes = b"<presence/>"):
+        """Sends a presence and remembers it to restore it after a reconnect."""
+
+        self.presence = presence
+        await self.send(presence)
+
+    async def request_iq(self, element: Element, timeout: float | None = 10) -> Element:
+        """
+        Sends an IQ and returns the matching result once the reader receives
+        it, so any number of requests can be in flight at the same time.
+
+        The IQ gets a unique id unless it already has one.
+
+        :raises IQError: if the server answers with an error
+        :raises asyncio.TimeoutError: if there is no answer within ``timeout``
+        :raises ConnectionError: if the connection drops before the answer
+        """
+
+        iq_id = element.get("id")
+        if iq_id is None:
+            iq_id = f"{self.__iq_prefix}_{next(self.__iq_ids)}"
+            element.set("id", iq_id)
+
+        future = asyncio.get_running_loop().create_future()
+        self.__pending_iqs[iq_id] = future
+        try:
+            await self.send(ElementTree.tostring(element, encoding="utf-8"))
+            response = await asyncio.wait_for(future, timeout)
+        finally:
+            self.__pending_iqs.pop(iq_id, None)
+
+        if response.get("type") == "error":
+            raise IQError(response)
+        return response
+
+    def _resolve_iq(self, element: Element) -> bool:
+        """Completes the request waiting for ``element``, if there is one."""
+
+        if element.get("type") not in ("result", "error"):
+            return False
+
+        future = self.__pending_iqs.pop(element.get("id"), None)
+        if future is None:
+            return False
+
+        if not future.done():
+            future.set_result(element)
+        return True
+
+    async def read_until(self, separator: bytes) -> bytes:
+        data = await asyncio.wait_for(self.reader.readuntil(separator), self.read_timeout)
+        self.last_received = time.monotonic()
+        return data
+
+    def set_socket_options(self, sock: socket.socket):
+        """
+        Lets the OS notice a peer that vanished without closing the socket,
+        without the options it only probes after hours of idling.
+        """
+
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        idle = max(1, int(self.keepalive_interval or 60))
+        options = [
+            ("TCP_KEEPIDLE", idle),
+            ("TCP_KEEPINTVL", max(1, idle // 4)),
+            ("TCP_KEEPCNT", 3),
+            # unacknowledged data, e.g. a ping, fails the socket after this
+            ("TCP_USER_TIMEOUT", int(self.keepalive_timeout * 1000)),
+        ]
+        for name, value in options:
+            if hasattr(socket, name):
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+                except OSError:
+                    # not supported for this socket, the pings still apply
+                    pass
+
+    async def ping(self, timeout: float | None = 10) -> float:
+        """
+        Pings the server (XEP-0199) and returns the round trip in seconds.
+
+        An error answer still proves the connection is alive, so it counts as
+        a pong.
+        """
+
+        iq_element = Element("iq", attrib={"type": "get", "to": f"{self.xmpp_region}.pvp.net"})
+        iq_element.append(Element("ping", attrib={"xmlns": "urn:xmpp:ping"}))
+
+        start = time.monotonic()
+        try:
+            await self.request_iq(iq_element, timeout)
+        except IQError:
+            pass
+        return time.monotonic() - start
+
+    async def keepalive(self):
+        """
+        Pings the server every ``keepalive_interval`` seconds and drops the
+        connection if the answer takes longer than ``keepalive_timeout``.
+
+        The pings are paused while the reader waits for the processors to catch
+        up, backpressure is not a dead connection.
+        """
+
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            if self.__reader_blocked:
+                continue
+
+            try:
+                await self.ping(self.keepalive_timeout)
+            except (OSError, asyncio.TimeoutError) as e:
+                if self.__reader_blocked and isinstance(e, asyncio.TimeoutError):
+                    # the answer is waiting in the socket until the reader resumes
+                    continue
+
+                self.__drop_reason = f"Keepalive failed: {e!r}"
+                # closing the socket wakes up the reader
+                writer = self.writer
+                if writer is not None:
+                    writer.transport.abort()
+                return
+
+    async def disconnect(self):
+        """Drops the current connection, :meth:`run` reconnects afterwards."""
+
+        if self.writer is None:
+            return
+
+        if self.stanza_writer is not None:
+            await self.stanza_writer.stop()
+            self.sent += self.stanza_writer.stanzas
+            self.stanza_writer = None
+        writer, self.writer = self.writer, None
+        writer.close()
+
+        reader_task = self.__reader_task
+        if reader_task is not None and reader_task is not asyncio.current_task():
+            # the reader stops once it sees the connection close
+            _, pending = await asyncio.wait([reader_task], timeout=5)
+            if pending:
+                writer.transport.abort()
+                await asyncio.wait([reader_task])
+            if not reader_task.cancelled():
+                # already reported by process_messages if it was awaited
+                reader_task.exception()
+
+        try:
+            await writer.wait_closed()
+        except (OSError, ssl.SSLError):
+            pass
 
     async def close(self):
         """Closes the XMPP client connection."""
 
         print("Closing connection...")
-        self.writer.close()
-        await self.writer.wait_closed()
+        self.__closing = True
+        if self.writer is not None:
+            try:
+                # let the last stanzas out before closing
+                await asyncio.wait_for(self.flush(), 5)
+            except (OSError, asyncio.TimeoutError):
+                pass
+        await self.disconnect()
 
     async def start_auth_flow(self):
-        """Starts the authentication flow for the XMPP client."""
+        """
+        Starts the authentication flow for the XMPP client.
+
+        Once the stream is authenticated the stanza reader is started, the
+        remaining steps are IQ requests answered through it.
+        """
 
-        # TODO add in checks for separators when a stanza fails
+        # contacts may have gone offline while we were not connected
+        self.presences.clear()
+
+        access_token = await self.val.auth.get_access_token()
         auth_flow = [
             {
                 "stanza": self.get_stream_element(),
@@ -141,7 +486,7 @@ class XMPP(abc.ABC):
                 "stage": "stream element",
             },
             {
-                "stanza": self.get_rso_auth(),
+                "stanza": await self.get_rso_auth(),
                 "seperator": b"</success>",
                 "stage": "RSO auth element",
             },
@@ -150,53 +495,187 @@ class XMPP(abc.ABC):
                 "seperator": b"</stream:features>",
                 "stage": "stream element",
             },
-            {
-                "stanza": self.get_bind_request(),
-                "seperator": b"</bind></iq>",
-                "stage": "bind element",
-            },
-            {
-                "stanza": self.get_entitlement_request(),
-                "seperator": b"></iq>",
-                "stage": "entitlement element",
-            },
-            {
-                "stanza": self.get_session_request(),
-                "seperator": b"</session></iq>",
-                "stage": "session element",
-            },
         ]
 
         # Start the auth flow
         for item in auth_flow:
             await self.send(item["stanza"])
-            await self.reader.readuntil(item["seperator"])
-
-        await self.send(b"<presence/>")
-        await self.reader.readuntil(b"</presence>")
+            try:
+                await self.read_until(item["seperator"])
+            except asyncio.IncompleteReadError as e:
+                if b"<failure" in e.partial:
+                    # the cached tokens were rejected, log in again before the
+                    # next attempt instead of retrying with the same ones
+                    await self.val.auth.refresh(access_token)
+                raise
+
+        self.start_reader()
+        await self.request_iq(self.get_bind_request())
+        await self.request_iq(await self.get_entitlement_request())
+        await self.request_iq(self.get_session_request())
+
+        await self.send_presence(self.presence)
         print("ended auth")
 
-    async def add_friend(self, name: str, tag: str) -> None:
-        await self.send(f"<iq id=\"roster_add_10\" type=\"set\"><query xmlns=\"jabber:iq:riotgames:roster\"><item "
-                        f"subscription=\"pending_out\"><id name=\"{name}\" tagline=\""
-                        f"{tag}\"/></item></query></iq>".encode("utf-8"))
+    async def run(self):
+        """
+        Connects, authenticates and processes the stream until :meth:`close` is
+        called, reconnecting with exponential backoff whenever the connection
+        drops.
+        """
 
-    async def process_messages(self):
-        while True:
-            self.buffer += await self.reader.read(4096)
+        self.__closing = False
+        delay = self.reconnect_delay
+        while not self.__closing:
             try:
-                xml_element: Element = ElementTree.fromstring(b"<wrapper>" + self.buffer + b"</wrapper>")
-                for root in xml_element:
-                    processor = self.processors.get(root.tag)
-                    if processor is None:
-                        print("Processor not implemented for" + root.tag)
-                        continue
+                if self.connect_limiter is None:
+                    await self.connect()
+                    await self.start_auth_flow()
+                else:
+                    async with self.connect_limiter:
+                        await self.connect()
+                        await self.start_auth_flow()
+                delay = self.reconnect_delay
+                await self.process_messages()
+            except CONNECTION_ERRORS + (IQError,) as e:
+                self.last_error = repr(e)
+                logger.warning("Connection lost: %r", e)
+            finally:
+                await self.disconnect()
+                self.connected_at = None
+
+            if self.__closing:
+                break
+
+            self.reconnects += 1
+            # jittered so many clients do not reconnect at the same instant
+            await asyncio.sleep(delay * random.uniform(0.5, 1))
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def stats(self) -> dict:
+        """Returns the health of the connection."""
+
+        now = time.monotonic()
+        return {
+            "connected": self.connected_at is not None,
+            "uptime": None if self.connected_at is None else now - self.connected_at,
+            "idle": None if self.connected_at is None else now - self.last_received,
+            "reconnects": self.reconnects,
+            "received": self.received,
+            "sent": self.sent + (0 if self.stanza_writer is None else self.stanza_writer.stanzas),
+            "buffered": 0 if self.stanza_writer is None else self.stanza_writer.buffered,
+            "pending_iqs": len(self.__pending_iqs),
+            "presences": len(self.presences),
+            "last_error": self.last_error,
+        }
 
-                    await self.processors[root.tag](root)
+    async def add_friend(self, name: str, tag: str) -> Element:
+        """Sends a friend request and returns the server's answer."""
 
-                self.buffer = b""
-            except ElementTree.ParseError:
-                continue
+        iq_element = Element("iq", attrib={"type": "set"})
+        query_element = Element("query", attrib={"xmlns": "jabber:iq:riotgames:roster"})
+        item_element = Element("item", attrib={"subscription": "pending_out"})
+        item_element.append(Element("id", attrib={"name": name, "tagline": tag}))
+        query_element.append(item_element)
+        iq_element.append(query_element)
+        return await self.request_iq(iq_element)
+
+    def start_reader(self):
+        """Starts reading stanzas in the background, if it is not running yet."""
+
+        if self.__reader_task is None or self.__reader_task.done():
+            self.__reader_task = asyncio.create_task(self._read_stanzas())
+
+    async def process_messages(self):
+        """
+        Processes the stream until the connection ends.
+
+        Every stanza is queued for its processor as soon as it closes, the
+        processors run on the dispatcher's workers. IQ results are handed to
+        the :meth:`request_iq` call waiting for them instead.
+        """
+
+        self.start_reader()
+        try:
+            await self.__reader_task
+        finally:
+            self.__reader_task = None
+
+    async def _read_stanzas(self):
+        self.parser.reset()
+        self.__drop_reason = None
+        if self.__owns_dispatcher:
+            self.dispatcher.start()
+        if self.keepalive_interval:
+            self.__keepalive_task = asyncio.create_task(self.keepalive())
+
+        try:
+            while True:
+                try:
+                    data = await asyncio.wait_for(self.reader.read(4096), self.read_timeout)
+                except asyncio.TimeoutError:
+                    self.last_error = f"Nothing received in {self.read_timeout}s"
+                    logger.warning("%s, dropping the connection", self.last_error)
+                    return
+
+                if not data:
+                    if self.__drop_reason is not None:
+                        self.last_error = self.__drop_reason
+                        logger.warning("%s, dropped the connection", self.__drop_reason)
+                    elif not self.__closing:
+                        self.last_error = "Connection closed by the server"
+                        logger.warning(self.last_error)
+                    return
+
+                self.last_received = time.monotonic()
+
+                try:
+                    stanzas = self.parser.feed(data)
+                except ElementTree.ParseError:
+                    # the server ended the stream, e.g. with </stream:stream>
+                    self.last_error = "Stream ended by the server"
+                    logger.warning(self.last_error)
+                    return
+
+                self.received += len(stanzas)
+                for stanza in stanzas:
+                    key = None
+                    if stanza.tag == "iq" and self._resolve_iq(stanza):
+                        continue
+
+                    if stanza.tag == "presence":
+                        # unchanged presences are not processed again
+                        if not self.presences.update(stanza):
+                            continue
+                        # a newer presence from the same JID replaces a queued one
+                        key = stanza.get("from")
+
+                    item = stanza
+                    if not self.__owns_dispatcher:
+                        # stanzas of every connection share the queues
+                        item = (self, stanza)
+                        key = None if key is None else (self, key)
+
+                    self.__reader_blocked = True
+                    try:
+                        queued = await self.dispatcher.put(stanza.tag, item, key)
+                    finally:
+                        self.__reader_blocked = False
+
+                    if not queued:
+                        logger.warning("Processor not implemented for %s", stanza.tag)
+        finally:
+            if self.__keepalive_task is not None:
+                self.__keepalive_task.cancel()
+                self.__keepalive_task = None
+
+            for future in self.__pending_iqs.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("The XMPP connection was closed"))
+            self.__pending_iqs.clear()
+
+            if self.__owns_dispatcher:
+                await self.dispatcher.stop()
 
     @abc.abstractmethod
     async def process_message(self, element: Element) -> None:
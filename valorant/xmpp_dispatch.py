@@ -0,0 +1,228 @@
+"""
+Queued stanza dispatch, decoupling the socket reader from slow handlers
+"""
+
+import asyncio
+import collections
+import logging
+from typing import Any, Awaitable, Callable, Hashable, Literal
+
+Overflow = Literal["block", "drop_oldest", "coalesce"]
+
+logger = logging.getLogger(__name__)
+
+
+class StanzaQueue:
+    """
+    A bounded FIFO queue with an overflow policy.
+
+    - ``block``: :meth:`put` waits until there is room
+    - ``drop_oldest``: the oldest queued item is discarded to make room
+    - ``coalesce``: an item replaces a queued one with the same key in place,
+      new keys drop the oldest item when the queue is full
+    """
+
+    def __init__(self, maxsize: int = 1000, overflow: Overflow = "block") -> None:
+        if overflow not in ("block", "drop_oldest", "coalesce"):
+            raise ValueError(f"Unknown overflow policy {overflow!r}")
+
+        if maxsize < 1:
+            # nothing could ever be queued, or dropped to make room
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.overflow = overflow
+
+        self.dropped = 0
+        self.coalesced = 0
+
+        # (key, item) pairs, coalesced items live in __latest instead
+        self.__items: collections.deque[tuple[Hashable | None, Any]] = (
+            collections.deque()
+        )
+        self.__latest: dict[Hashable, Any] = {}
+        self.__changed = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def _drop_oldest(self) -> None:
+        key, _ = self.__items.popleft()
+        if key is not None:
+            del self.__latest[key]
+        self.dropped += 1
+
+    async def put(self, item: Any, key: Hashable | None = None) -> None:
+        async with self.__changed:
+            coalesce = self.overflow == "coalesce" and key is not None
+            if coalesce and key in self.__latest:
+                self.__latest[key] = item
+                self.coalesced += 1
+                return
+
+            while len(self.__items) >= self.maxsize:
+                if self.overflow == "block":
+                    await self.__changed.wait()
+                else:
+                    self._drop_oldest()
+
+            if coalesce:
+                self.__latest[key] = item
+                self.__items.append((key, None))
+            else:
+                self.__items.append((None, item))
+
+            self.__changed.notify_all()
+
+    async def get(self) -> Any:
+        async with self.__changed:
+            while not self.__items:
+                await self.__changed.wait()
+
+            key, item = self.__items.popleft()
+            if key is not None:
+                item = self.__latest.pop(key)
+
+            self.__changed.notify_all()
+            return item
+
+
+class StanzaDispatcher:
+    """
+    Routes items to per-kind queues consumed by worker tasks.
+
+    The reader only awaits :meth:`put`, which returns immediately unless a
+    ``block`` queue is full, so a slow handler no longer stops the socket
+    from being read.
+
+    :param handlers: the coroutine function handling each kind of item
+    :param workers: worker tasks per kind, a single worker keeps items of
+        that kind in order
+    :param maxsize: queue size per kind
+    :param overflow: overflow policy per kind, see :class:`StanzaQueue`
+    """
+
+    def __init__(
+        self,
+        handlers: dict[str, Callable[[Any], Awaitable[None]]],
+        workers: int | dict[str, int] = 1,
+        maxsize: int | dict[str, int] = 1000,
+        overflow: Overflow | dict[str, Overflow] = "block",
+    ) -> None:
+        def per_kind(value, kind: str, default):
+            return value.get(kind, default) if isinstance(value, dict) else value
+
+        self.handlers = handlers
+        self.workers = {kind: per_kind(workers, kind, 1) for kind in handlers}
+        self.queues = {
+            kind: StanzaQueue(
+                per_kind(maxsize, kind, 1000), per_kind(overflow, kind, "block")
+            )
+            for kind in handlers
+        }
+
+        self.processed = dict.fromkeys(handlers, 0)
+        self.failed = dict.fromkeys(handlers, 0)
+        self.__busy = dict.fromkeys(handlers, 0)
+        self.__tasks: list[asyncio.Task] = []
+        # notified by the workers while someone waits in join()
+        self.__changed = asyncio.Condition()
+        self.__joining = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self.__tasks)
+
+    def start(self) -> None:
+        if self.__tasks:
+            return
+
+        for kind, count in self.workers.items():
+            for _ in range(count):
+                self.__tasks.append(asyncio.create_task(self._work(kind)))
+
+    @property
+    def idle(self) -> bool:
+        """Whether nothing is queued and no handler is running."""
+
+        return not any(self.__busy.values()) and not any(map(len, self.queues.values()))
+
+    async def join(self) -> None:
+        """Waits until every queued item has been handled."""
+
+        if not self.__tasks:
+            return
+
+        self.__joining += 1
+        try:
+            async with self.__changed:
+                await self.__changed.wait_for(lambda: self.idle)
+        finally:
+            self.__joining -= 1
+
+    async def stop(self, timeout: float | None = 5) -> None:
+        """
+        Lets the workers handle what is queued for up to ``timeout`` seconds,
+        then cancels them. Handlers still running are interrupted, items still
+        queued are kept for a restart and are lost if there is none.
+        """
+
+        if self.__tasks and timeout != 0:
+            try:
+                await asyncio.wait_for(self.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Stopping the dispatcher with %d handlers running and %d items queued",
+                    sum(self.__busy.values()),
+                    sum(map(len, self.queues.values())),
+                )
+
+        for task in self.__tasks:
+            task.cancel()
+
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks = []
+
+    async def put(self, kind: str, item: Any, key: Hashable | None = None) -> bool:
+        """Queues ``item``, returns ``False`` if there is no handler for ``kind``."""
+
+        queue = self.queues.get(kind)
+        if queue is None:
+            return False
+
+        await queue.put(item, key)
+        return True
+
+    async def _work(self, kind: str) -> None:
+        queue = self.queues[kind]
+        handler = self.handlers[kind]
+        while True:
+            item = await queue.get()
+            self.__busy[kind] += 1
+            try:
+                await handler(item)
+                self.processed[kind] += 1
+            except Exception:
+                self.failed[kind] += 1
+                logger.exception("Handler for %s failed", kind)
+            finally:
+                self.__busy[kind] -= 1
+
+            if self.__joining:
+                async with self.__changed:
+                    self.__changed.notify_all()
+
+    def metrics(self) -> dict[str, dict[str, int]]:
+        """Returns the queue depth and counters of every kind."""
+
+        return {
+            kind: {
+                "depth": len(queue),
+                "busy": self.__busy[kind],
+                "processed": self.processed[kind],
+                "failed": self.failed[kind],
+                "dropped": queue.dropped,
+                "coalesced": queue.coalesced,
+            }
+            for kind, queue in self.queues.items()
+        }
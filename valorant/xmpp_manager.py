@@ -0,0 +1,155 @@
+"""
+Many XMPP connections supervised in one event loop
+"""
+
+import asyncio
+import logging
+import ssl
+from typing import Any
+
+from valorant.pool import SessionPool
+from valorant.xmpp import XMPP
+from valorant.xmpp_dispatch import Overflow, StanzaDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+class XMPPManager:
+    """
+    Runs one XMPP connection per account in the same event loop.
+
+    The connections share an SSL context, the token and HTTP infrastructure
+    of a :class:`~valorant.pool.SessionPool` and a single dispatcher, which
+    calls the processors of the connection each stanza arrived on. Connecting
+    and authenticating is staggered and limited to ``max_connecting`` at a
+    time, reconnects included, so a network blip does not turn into a
+    stampede on the chat servers.
+
+    A connection that fails for good, e.g. because of wrong credentials, is
+    stopped on its own with the error in its ``last_error``, the others keep
+    running.
+
+    :param connection_class: the :class:`~valorant.xmpp.XMPP` subclass
+        implementing the processors
+    :param pool: the pool the accounts are added to, one is created if not
+        given and closed by :meth:`close`
+    :param connect_interval: seconds between starting two connections
+    :param max_connecting: connections connecting or authenticating at once
+    :param options: passed to every connection, see :class:`~valorant.xmpp.XMPP`
+    """
+
+    def __init__(
+        self,
+        connection_class: type[XMPP],
+        pool: SessionPool | None = None,
+        connect_interval: float = 0.1,
+        max_connecting: int = 10,
+        workers: int | dict[str, int] = 4,
+        queue_size: int | dict[str, int] = 10000,
+        overflow: Overflow | dict[str, Overflow] | None = None,
+        **options: Any,
+    ) -> None:
+        self.connection_class = connection_class
+        self.__owns_pool = pool is None
+        self.pool = pool or SessionPool()
+        self.connect_interval = connect_interval
+        self.options = options
+
+        self.context = ssl.create_default_context()
+        self.context.check_hostname = True
+        self.context.verify_mode = ssl.CERT_REQUIRED
+
+        self.dispatcher = StanzaDispatcher(
+            {kind: self._make_handler(kind) for kind in ("presence", "iq", "message")},
+            workers,
+            queue_size,
+            {"presence": "coalesce"} if overflow is None else overflow,
+        )
+        self.connect_limiter = asyncio.Semaphore(max_connecting)
+
+        self.connections: list[XMPP] = []
+        self.__tasks: dict[XMPP, asyncio.Task] = {}
+
+    @staticmethod
+    def _make_handler(kind: str):
+        async def handle(item: tuple[XMPP, Any]) -> None:
+            connection, element = item
+            await connection.processors[kind](element)
+
+        return handle
+
+    def add(self, username: str, password: str, **options: Any) -> XMPP:
+        """Adds an account, it is connected by :meth:`start`."""
+
+        connection = self.connection_class(
+            username,
+            password,
+            valorant=self.pool.add(username, password),
+            context=self.context,
+            dispatcher=self.dispatcher,
+            connect_limiter=self.connect_limiter,
+            **(self.options | options),
+        )
+        self.connections.append(connection)
+        return connection
+
+    async def _run(self, connection: XMPP, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            await connection.run()
+        except Exception as error:
+            # connection errors are retried by run(), anything reaching this
+            # point would fail again, e.g. rejected credentials
+            connection.last_error = repr(error)
+            logger.exception(
+                "Connection of %s failed, it is not retried",
+                connection.val.auth.username,
+            )
+
+    async def start(self) -> None:
+        """Starts the connections not running yet, ``connect_interval`` apart."""
+
+        self.dispatcher.start()
+
+        delay = 0.0
+        for connection in self.connections:
+            task = self.__tasks.get(connection)
+            if task is not None and not task.done():
+                continue
+
+            self.__tasks[connection] = asyncio.create_task(self._run(connection, delay))
+            delay += self.connect_interval
+
+    async def run(self) -> None:
+        """
+        Starts every connection and waits until all of them are closed or
+        failed for good.
+        """
+
+        await self.start()
+        await asyncio.gather(*self.__tasks.values())
+
+    def stats(self) -> dict[str, dict]:
+        """Returns the health of every connection, by username."""
+
+        return {
+            connection.val.auth.username: connection.stats()
+            for connection in self.connections
+        }
+
+    def metrics(self) -> dict[str, dict[str, int]]:
+        """Returns the shared dispatcher's queue metrics."""
+
+        return self.dispatcher.metrics()
+
+    async def close(self) -> None:
+        await asyncio.gather(*(connection.close() for connection in self.connections))
+        # connections still waiting for their turn to connect never started
+        for task in self.__tasks.values():
+            task.cancel()
+        await asyncio.gather(*self.__tasks.values(), return_exceptions=True)
+        self.__tasks.clear()
+
+        await self.dispatcher.stop()
+        if self.__owns_pool:
+            await self.pool.close()
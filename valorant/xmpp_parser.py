@@ -0,0 +1,57 @@
+"""
+Incremental parser for the XMPP stream
+"""
+
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
+
+
+class StanzaParser:
+    """
+    Feeds raw stream data to a pull parser and returns every top-level stanza
+    as soon as its closing tag arrives.
+
+    Emitted stanzas are detached from the parser's tree, so memory only holds
+    the stanza currently being received.
+    """
+
+    def __init__(self) -> None:
+        self.__parser: ElementTree.XMLPullParser | None = None
+        self.__root: Element | None = None
+        self.__depth = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Discards any partial stanza and starts a new stream."""
+
+        self.__parser = ElementTree.XMLPullParser(events=("start", "end"))
+        # the stream header is consumed by the auth flow, so stanzas arrive
+        # without a root element
+        self.__parser.feed(b"<wrapper>")
+        self.__root = None
+        self.__depth = 0
+
+    def feed(self, data: bytes) -> list[Element]:
+        """
+        Returns the stanzas completed by ``data``.
+
+        :raises xml.etree.ElementTree.ParseError: if the stream is not well
+            formed, e.g. when the server closes it with ``</stream:stream>``
+        """
+
+        self.__parser.feed(data)
+
+        stanzas = []
+        for event, element in self.__parser.read_events():
+            if event == "start":
+                if self.__depth == 0:
+                    self.__root = element
+                self.__depth += 1
+                continue
+
+            self.__depth -= 1
+            if self.__depth == 1:
+                self.__root.remove(element)
+                stanzas.append(element)
+
+        return stanzas
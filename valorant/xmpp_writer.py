@@ -0,0 +1,157 @@
+"""
+Buffered writer that batches outgoing stanzas into large TLS writes
+"""
+
+import asyncio
+from typing import Iterable
+
+
+class StanzaWriter:
+    """
+    Queues outgoing stanzas and writes them from a single task.
+
+    Stanzas queued within ``linger`` seconds of each other are joined and
+    written at once, so a burst of stanzas costs one write, one drain and
+    usually one TLS record instead of one per stanza.
+
+    :param linger: seconds to wait for more stanzas before writing a batch,
+        0 writes as soon as the writer task runs
+    :param high_water: buffered bytes above which :meth:`send` waits
+    :param low_water: buffered bytes below which waiting senders resume, the
+        watermarks are also applied to the transport's write buffer
+    """
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        linger: float = 0.002,
+        high_water: int = 64 * 1024,
+        low_water: int = 16 * 1024,
+    ) -> None:
+        if low_water > high_water:
+            raise ValueError("low_water must not be larger than high_water")
+
+        self.writer = writer
+        self.linger = linger
+        self.high_water = high_water
+        self.low_water = low_water
+
+        writer.transport.set_write_buffer_limits(high_water, low_water)
+
+        self.__buffer: list[bytes] = []
+        self.__size = 0
+        self.__queued = 0
+        self.__written = 0
+        self.__error: BaseException | None = None
+        self.__ready = asyncio.Event()
+        self.__changed = asyncio.Condition()
+        self.__task: asyncio.Task | None = None
+
+        self.writes = 0
+        self.stanzas = 0
+
+    @property
+    def buffered(self) -> int:
+        """Bytes queued but not written yet."""
+
+        return self.__size
+
+    def start(self) -> None:
+        if self.__error is not None:
+            raise self.__error
+
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the writer task, queued stanzas that were not written are lost
+        and later sends and flushes raise :class:`ConnectionError`.
+        """
+
+        if self.__error is None:
+            self.__error = ConnectionError("The stanza writer was stopped")
+        async with self.__changed:
+            self.__changed.notify_all()
+
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+
+    async def send(self, stanza: bytes) -> None:
+        await self.send_many((stanza,))
+
+    async def send_many(self, stanzas: Iterable[bytes]) -> None:
+        """
+        Queues several stanzas at once, waiting first if the buffer is above
+        the high watermark.
+
+        :raises OSError: if an earlier write failed or the writer was stopped
+        """
+
+        if self.__error is not None:
+            raise self.__error
+
+        if self.__size >= self.high_water:
+            async with self.__changed:
+                await self.__changed.wait_for(
+                    lambda: self.__size <= self.low_water or self.__error is not None
+                )
+
+        if self.__error is not None:
+            raise self.__error
+
+        for stanza in stanzas:
+            self.__buffer.append(stanza)
+            self.__size += len(stanza)
+            self.__queued += len(stanza)
+            self.stanzas += 1
+
+        self.__ready.set()
+
+    async def flush(self) -> None:
+        """
+        Waits until everything queued so far has been written and drained.
+
+        :raises OSError: if a write failed or the writer was stopped
+        """
+
+        target = self.__queued
+        async with self.__changed:
+            await self.__changed.wait_for(
+                lambda: self.__written >= target or self.__error is not None
+            )
+
+        if self.__error is not None:
+            raise self.__error
+
+    async def _run(self) -> None:
+        while True:
+            await self.__ready.wait()
+            if self.linger and self.__size < self.low_water:
+                # let the rest of a burst join this batch
+                await asyncio.sleep(self.linger)
+
+            self.__ready.clear()
+            batch, self.__buffer = self.__buffer, []
+            data = b"".join(batch)
+
+            try:
+                self.writer.write(data)
+                await self.writer.drain()
+            except (OSError, RuntimeError) as error:
+                # RuntimeError is raised when writing to a closed transport
+                self.__error = error if isinstance(error, OSError) else OSError(error)
+                async with self.__changed:
+                    self.__changed.notify_all()
+                return
+
+            self.writes += 1
+            async with self.__changed:
+                self.__size -= len(data)
+                self.__written += len(data)
+                self.__changed.notify_all()